@@ -167,6 +167,14 @@ DEFAULT_OUTPUT_DIR = os.getenv("DEFAULT_OUTPUT_DIR", "artifacts")
 # Default base URL for API testing
 DEFAULT_BASE_URL = os.getenv("DEFAULT_BASE_URL", "http://localhost:8000")
 
+# Directory persisting extracted code contexts across runs; empty disables it.
+# Entries are copies of analysed source code, so the directory is created
+# readable by its owner only
+EXTRACT_CACHE_DIR = os.getenv("EXTRACT_CACHE_DIR", "")
+
+# Maximum number of cached extracts; the oldest are pruned beyond this
+EXTRACT_CACHE_MAX_ENTRIES = int(os.getenv("EXTRACT_CACHE_MAX_ENTRIES", "512"))
+
 
 # ==============================================================================
 # CONFIGURATION SUMMARY (for debugging)
@@ -6,11 +6,98 @@ Uses tree-sitter for robust AST parsing, extracting signatures and type info.
 """
 
 import logging
+import re
 from typing import Optional
 from ...utils.tree_sitter_loader import get_parser
 
 logger = logging.getLogger(__name__)
 
+# Punctuation tokens skipped when walking type arguments / tuple members / union options.
+_GENERIC_PUNCT = frozenset(("<", ">", ","))
+_TUPLE_PUNCT = frozenset(("[", "]", ","))
+_UNION_PUNCT = frozenset(("|",))
+
+_FUNCTION_NODE_TYPES = frozenset(("function_declaration", "method_definition"))
+_PARAMETER_NODE_TYPES = frozenset(("required_parameter", "optional_parameter"))
+
+# Shared result for zero-argument functions. Only ever wrapped into a body
+# schema by _build_operation; nothing downstream mutates it.
+_NO_PARAMS: tuple = ({}, [])
+
+# Literal texts accepted by int() / float() (the latter only for texts with a "."),
+# so numbers are detected without exception handling
+_INT_LITERAL_RE = re.compile(r"[+-]?\d+(?:_\d+)*")
+_FLOAT_LITERAL_RE = re.compile(
+    r"[+-]?(?=\.?\d)(?:\d+(?:_\d+)*)?\.(?:\d+(?:_\d+)*)?(?:[eE][+-]?\d+(?:_\d+)*)?"
+)
+
+
+def _first_non_punct(node, skip=_GENERIC_PUNCT):
+    """Return the first child of `node` whose type is not in `skip`, or None.
+
+    Uses a TreeCursor so no Python list of children is materialized.
+    """
+    cursor = node.walk()
+    if not cursor.goto_first_child():
+        return None
+    while cursor.node.type in skip:
+        if not cursor.goto_next_sibling():
+            return None
+    return cursor.node
+
+
+def _iter_non_punct(node, skip):
+    """Yield the children of `node` whose type is not in `skip` via a TreeCursor."""
+    cursor = node.walk()
+    if not cursor.goto_first_child():
+        return
+    while True:
+        if cursor.node.type not in skip:
+            yield cursor.node
+        if not cursor.goto_next_sibling():
+            return
+
+
+def _build_operation(
+    func_name: str,
+    is_async: bool,
+    description: str,
+    properties: dict,
+    required: list,
+    return_schema: dict,
+) -> dict:
+    """Build the IR operation for a parsed function or arrow function."""
+    return {
+        "id": func_name,
+        "kind": "typescript_function",
+        "async": is_async,
+        "description": description,
+        "metadata": {},
+        "inputs": {
+            "path": [],
+            "query": [],
+            "headers": [],
+            "body": {
+                "content_type": "application/json",
+                "required": True,
+                "schema": {
+                    "type": "object",
+                    "properties": properties,
+                    "required": required,
+                    "additionalProperties": False,
+                },
+            },
+        },
+        "outputs": [
+            {
+                "status": 200,
+                "content_type": "application/json",
+                "schema": return_schema,
+            }
+        ],
+        "errors": [],
+    }
+
 
 class TypeScriptParser:
     """
@@ -20,6 +107,10 @@ class TypeScriptParser:
     def __init__(self, source_code: str):
         self.source_code = source_code
         self.parser = get_parser("typescript")
+        # Schemas derived from type expressions, keyed by (node kind, source text).
+        # Repeated types (`string`, `User`, `Array<string>`) are mapped once and
+        # shared by reference.
+        self._schema_memo: dict[tuple[str, str], dict] = {}
 
     def parse(self) -> dict:
         """Parse TypeScript source code and return IR-compatible operations."""
@@ -31,7 +122,7 @@ class TypeScriptParser:
         # Traverse for function definitions
         # We look for: function_declaration, arrow_function, method_definition
         for node in self._traverse_tree(root_node):
-            if node.type in ["function_declaration", "method_definition"]:
+            if node.type in _FUNCTION_NODE_TYPES:
                 op = self._parse_node(node)
                 if op:
                     operations.append(op)
@@ -108,39 +199,14 @@ class TypeScriptParser:
         # Get docstring (comments before the node)
         description = self._get_docstring(node)
 
-        # Build Body Schema
-        body_schema = {
-            "type": "object",
-            "properties": properties,
-            "required": required,
-            "additionalProperties": False,
-        }
-
-        return {
-            "id": func_name,
-            "kind": "typescript_function",
-            "async": is_async,
-            "description": description or f"TypeScript function: {func_name}",
-            "metadata": {},
-            "inputs": {
-                "path": [],
-                "query": [],
-                "headers": [],
-                "body": {
-                    "content_type": "application/json",
-                    "required": True,
-                    "schema": body_schema,
-                },
-            },
-            "outputs": [
-                {
-                    "status": 200,
-                    "content_type": "application/json",
-                    "schema": return_schema,
-                }
-            ],
-            "errors": [],
-        }
+        return _build_operation(
+            func_name,
+            is_async,
+            description or f"TypeScript function: {func_name}",
+            properties,
+            required,
+            return_schema,
+        )
 
     def _parse_arrow_function(self, name_node, arrow_node) -> dict:
         """Parse arrow functions explicitly."""
@@ -168,49 +234,25 @@ class TypeScriptParser:
         grandparent = parent.parent  # lexical_declaration
         description = self._get_docstring(grandparent)
 
-        body_schema = {
-            "type": "object",
-            "properties": properties,
-            "required": required,
-            "additionalProperties": False,
-        }
-
-        return {
-            "id": func_name,
-            "kind": "typescript_function",
-            "async": is_async,
-            "description": description or f"TypeScript arrow function: {func_name}",
-            "metadata": {},
-            "inputs": {
-                "path": [],
-                "query": [],
-                "headers": [],
-                "body": {
-                    "content_type": "application/json",
-                    "required": True,
-                    "schema": body_schema,
-                },
-            },
-            "outputs": [
-                {
-                    "status": 200,
-                    "content_type": "application/json",
-                    "schema": return_schema,
-                }
-            ],
-            "errors": [],
-        }
+        return _build_operation(
+            func_name,
+            is_async,
+            description or f"TypeScript arrow function: {func_name}",
+            properties,
+            required,
+            return_schema,
+        )
 
     def _parse_parameters(self, params_node):
         """Returns (properties, required_list)"""
+        if not params_node or not params_node.named_child_count:
+            return _NO_PARAMS
+
         properties = {}
         required = []
 
-        if not params_node:
-            return properties, required
-
         for child in params_node.children:
-            if child.type in ["required_parameter", "optional_parameter"]:
+            if child.type in _PARAMETER_NODE_TYPES:
                 name_node = child.child_by_field_name(
                     "pattern"
                 )  # 'pattern' holds identifier
@@ -238,13 +280,21 @@ class TypeScriptParser:
         return properties, required
 
     def _node_to_schema(self, type_node) -> dict:
-        """Map TS type nodes to JSON schema"""
+        """Map TS type nodes to JSON schema (memoized per type expression)."""
         if not type_node:
             return {}
 
         kind = type_node.type
         text = self._get_text(type_node)
-
+        key = (kind, text)
+        schema = self._schema_memo.get(key)
+        if schema is None:
+            schema = self._build_schema(type_node, kind, text)
+            self._schema_memo[key] = schema
+        return schema
+
+    def _build_schema(self, type_node, kind: str, text: str) -> dict:
+        """Map a single TS type node to JSON schema"""
         if kind == "predefined_type":
             if text == "string":
                 return {"type": "string"}
@@ -264,26 +314,21 @@ class TypeScriptParser:
 
             if name == "Array":
                 args = type_node.child_by_field_name("type_arguments")
-                if args and args.children:
-                    # filtering checking children for type nodes
+                if args:
                     # standard struct: <, type, >
-                    sub_types = [
-                        c for c in args.children if c.type not in ["<", ">", ","]
-                    ]
-                    if sub_types:
+                    sub_type = _first_non_punct(args)
+                    if sub_type:
                         return {
                             "type": "array",
-                            "items": self._node_to_schema(sub_types[0]),
+                            "items": self._node_to_schema(sub_type),
                         }
 
             if name == "Promise":
                 args = type_node.child_by_field_name("type_arguments")
-                if args and args.children:
-                    sub_types = [
-                        c for c in args.children if c.type not in ["<", ">", ","]
-                    ]
-                    if sub_types:
-                        return self._node_to_schema(sub_types[0])
+                if args:
+                    sub_type = _first_non_punct(args)
+                    if sub_type:
+                        return self._node_to_schema(sub_type)
 
             # Fallback for named refs
             return {"type": "object", "description": f"Ref: {name}"}
@@ -296,11 +341,10 @@ class TypeScriptParser:
         if kind == "union_type":
             # A | B
             # children: type, |, type
-            options = []
-            for child in type_node.children:
-                if child.type == "|":
-                    continue
-                options.append(self._node_to_schema(child))
+            options = [
+                self._node_to_schema(c)
+                for c in _iter_non_punct(type_node, _UNION_PUNCT)
+            ]
 
             # Filter nulls
             non_null = [o for o in options if o.get("type") != "null"]
@@ -309,7 +353,8 @@ class TypeScriptParser:
             if len(non_null) == 1:
                 s = non_null[0]
                 if has_null:
-                    s["nullable"] = True
+                    # Copy: `s` may be a memoized schema shared with other nodes
+                    s = {**s, "nullable": True}
                 return s
 
             s = {"oneOf": non_null}
@@ -322,7 +367,7 @@ class TypeScriptParser:
             props = {}
             # Iterate members
             for child in type_node.children:
-                if child.type in ["property_signature", "property_signature"]:
+                if child.type == "property_signature":
                     pname = self._get_text(child.child_by_field_name("name"))
                     ptype = child.child_by_field_name("type")
                     if ptype and ptype.children:
@@ -332,11 +377,10 @@ class TypeScriptParser:
 
         if kind == "tuple_type":
             # [string, number]
-            items = []
-            for child in type_node.children:
-                if child.type in ["[", "]", ","]:
-                    continue
-                items.append(self._node_to_schema(child))
+            items = [
+                self._node_to_schema(c)
+                for c in _iter_non_punct(type_node, _TUPLE_PUNCT)
+            ]
             return {
                 "type": "array",
                 "prefixItems": items,
@@ -346,17 +390,16 @@ class TypeScriptParser:
 
         if kind == "literal_type":
             # "foo" or 123
-            text = self._get_text(type_node)
             # Strip quotes
-            if text.startswith("'") or text.startswith('"'):
+            if text[:1] in ("'", '"'):
                 return {"const": text[1:-1]}
-            # Try number
-            try:
-                if "." in text:
+            # Number (checked up front instead of via int()/float() exceptions)
+            if "." in text:
+                if _FLOAT_LITERAL_RE.fullmatch(text):
                     return {"const": float(text)}
+            elif _INT_LITERAL_RE.fullmatch(text):
                 return {"const": int(text)}
-            except:
-                return {"const": text}
+            return {"const": text}
 
         return {"type": "object", "description": f"TS Type: {kind}"}
 
@@ -370,28 +413,27 @@ class TypeScriptParser:
         # But commonly they are 'comment' nodes in the tree.
 
         # We search backward from node
+        # Comments are collected nearest-first and reversed once at the end.
         prev = node.prev_sibling
         comments = []
         while prev:
-            if prev.type == "comment":
-                text = self._get_text(prev)
+            t = prev.type
+            if t == "comment":
                 # Clean up // or /* */
-                cleaned = text.strip()
+                cleaned = self._get_text(prev).strip()
                 if cleaned.startswith("//"):
                     cleaned = cleaned[2:].strip()
                 elif cleaned.startswith("/*"):
                     cleaned = cleaned[2:-2].strip()
-                comments.insert(0, cleaned)
+                comments.append(cleaned)
                 prev = prev.prev_sibling
-            elif prev.type in ["export", "async"]:
+            elif t in ("export", "async"):
                 # Skip modifiers to find comments before them
                 prev = prev.prev_sibling
-            elif str(prev.type).strip() == "":
-                # Whitespace/Text nodes?
-                prev = prev.prev_sibling
             else:
                 break
 
+        comments.reverse()
         return "\n".join(comments)
 
 
@@ -1,9 +1,10 @@
 """Pre-parsing validation logic for input files."""
 
+import codecs
 import json
 import ast
 from pathlib import Path
-from typing import Union
+from typing import List, Optional, Set, Union
 
 from testsuitegen.src.exceptions.exceptions import InvalidSpecError, FileError
 
@@ -34,37 +35,45 @@ def validate_input_spec(file_path: Union[str, Path]):
             "Supported formats are: .json, .yaml, .yml, .py",
         )
 
-    # 2. Read content safely
+    # 2. Read content safely (raw bytes; json/yaml/ast all decode UTF-8 themselves)
     try:
-        content = path.read_text(encoding="utf-8")
+        content = path.read_bytes()
     except Exception as e:
         raise FileError(f"Could not read file: {file_path}", str(e))
 
-    # 3. Validate Structure based on type
-    if suffix == ".py":
-        _validate_python_structure(path, content)
-    else:
-        _validate_openapi_structure(path, content, suffix)
+    # 3. Validate Structure based on type. Content that is not valid UTF-8 is
+    # reported as unreadable, the same as a failed text read
+    try:
+        if suffix == ".py":
+            _validate_python_structure(path, content)
+        else:
+            _validate_openapi_structure(path, content, suffix)
+    except UnicodeDecodeError as e:
+        raise FileError(f"Could not read file: {file_path}", str(e))
 
 
-def _validate_openapi_structure(path: Path, content: str, suffix: str):
+def _validate_openapi_structure(path: Path, content: bytes, suffix: str):
     """Validates OpenAPI YAML/JSON structure."""
     try:
         if suffix == ".json":
             data = json.loads(content)
+            root_keys = data if isinstance(data, dict) else None
         else:
-            # Basic YAML import (assuming pyyaml is installed)
-            import yaml
-
-            data = yaml.safe_load(content)
+            root_keys = _scan_yaml_root_keys(content)
     except json.JSONDecodeError as e:
         raise InvalidSpecError(
             f"Invalid JSON syntax in {path.name}",
             f"Line {e.lineno}, Column {e.colno}: {e.msg}",
         )
+    except UnicodeDecodeError:
+        raise
     except Exception as e:
         # Handle YAML errors or other parsing issues
         if "yaml" in str(type(e).__module__):
+            if type(e).__name__ == "ReaderError":
+                # Surfaces as UnicodeDecodeError (unreadable file) when the
+                # bytes are not UTF-8; other reader errors are syntax errors
+                content.decode("utf-8")
             # YAML error
             problem_mark = e.problem_mark if hasattr(e, "problem_mark") else None
             location = (
@@ -77,31 +86,124 @@ def _validate_openapi_structure(path: Path, content: str, suffix: str):
         raise InvalidSpecError(f"Failed to parse OpenAPI file", str(e))
 
     # Structural Checks (Deep enough to catch basic issues, fast enough to run instantly)
-    if not isinstance(data, dict):
+    if root_keys is None:
         raise InvalidSpecError(
             "Root element must be an object (dictionary)",
             "The file provided is likely a list or raw value.",
         )
 
     # Check for OpenAPI version (v3.x or v2.0)
-    if "openapi" not in data and "swagger" not in data:
+    if "openapi" not in root_keys and "swagger" not in root_keys:
         raise InvalidSpecError(
             "Missing 'openapi' or 'swagger' key at root level",
             "This file does not appear to be a valid OpenAPI specification.",
         )
 
     # Check for paths
-    if "paths" not in data:
+    if "paths" not in root_keys:
         raise InvalidSpecError(
             "Missing 'paths' key at root level",
             "An OpenAPI spec must define paths/endpoints to generate tests.",
         )
 
 
-def _validate_python_structure(path: Path, content: str):
+def _scan_yaml_root_keys(content: bytes) -> Optional[Set[str]]:
+    """
+    Collects the top-level keys of a YAML document from the event stream.
+
+    The whole stream is read, so syntax errors anywhere and extra documents
+    are still reported, but no object graph is built. Input the event stream
+    cannot judge on its own (explicit tags, complex or aliased keys, unknown
+    aliases, timestamps, a root '<<' merge key) falls back to `yaml.safe_load`.
+    Returns None if the root is not a mapping.
+    """
+    import yaml
+
+    if content.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        # yaml would decode UTF-16 by its BOM; specs must be UTF-8
+        content.decode("utf-8")
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    keys: Set[str] = set()
+    root_is_mapping = False
+    # One entry per open collection: True/False = mapping expecting a key or
+    # a value, None = sequence
+    stack: List[Optional[bool]] = []
+    anchors: Set[str] = set()
+    document_start = None
+    resolver = yaml.resolver.Resolver()
+
+    for event in yaml.parse(content, Loader=loader):
+        if isinstance(event, yaml.DocumentStartEvent):
+            if document_start is not None:
+                raise yaml.composer.ComposerError(
+                    "expected a single document in the stream",
+                    document_start.start_mark,
+                    "but found another document",
+                    event.start_mark,
+                )
+            document_start = event
+            continue
+
+        if isinstance(event, (yaml.MappingEndEvent, yaml.SequenceEndEvent)):
+            stack.pop()
+            continue
+
+        if not isinstance(event, yaml.NodeEvent):
+            continue
+
+        if isinstance(event, yaml.AliasEvent):
+            if event.anchor not in anchors:
+                return _safe_load_root_keys(content)
+        else:
+            if event.tag is not None:
+                return _safe_load_root_keys(content)
+            if event.anchor is not None:
+                anchors.add(event.anchor)
+            # Only constructing a timestamp checks that the date is valid
+            if (
+                isinstance(event, yaml.ScalarEvent)
+                and resolver.resolve(yaml.ScalarNode, event.value, event.implicit)
+                == "tag:yaml.org,2002:timestamp"
+            ):
+                return _safe_load_root_keys(content)
+
+        if stack and stack[-1] is not None:
+            expecting_key = stack[-1]
+            if expecting_key:
+                if not isinstance(event, yaml.ScalarEvent):
+                    return _safe_load_root_keys(content)
+                if len(stack) == 1:
+                    if event.value == "<<" and event.implicit[0]:
+                        return _safe_load_root_keys(content)
+                    keys.add(event.value)
+            stack[-1] = not expecting_key
+        elif not stack:
+            root_is_mapping = isinstance(event, yaml.MappingStartEvent)
+
+        if isinstance(event, yaml.MappingStartEvent):
+            stack.append(True)
+        elif isinstance(event, yaml.SequenceStartEvent):
+            stack.append(None)
+
+    return keys if root_is_mapping else None
+
+
+def _safe_load_root_keys(content: bytes) -> Optional[Set]:
+    """Top-level keys of a fully constructed YAML document."""
+    import yaml
+
+    data = yaml.load(content, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+    return set(data) if isinstance(data, dict) else None
+
+
+def _validate_python_structure(path: Path, content: bytes):
     """Validates Python syntax using AST."""
+    # Decoded here rather than by ast, which would honour a coding cookie and
+    # report invalid UTF-8 as a SyntaxError
+    source = content.decode("utf-8")
     try:
-        ast.parse(content, filename=str(path))
+        ast.parse(source, filename=str(path))
     except SyntaxError as e:
         raise InvalidSpecError(
             f"Python syntax error in {path.name}", f"Line {e.lineno}: {e.msg}"
@@ -7,12 +7,19 @@ This is deterministic - no LLM involved.
 
 from typing import List, Dict, Any
 from dataclasses import dataclass, field
+import functools
 import logging
+import re
 
 logger = logging.getLogger(__name__)
 
+_PATH_PARAM_RE = re.compile(r"/\{[^}]+\}")
 
-@dataclass
+# Methods whose path params refer to a resource that must already exist
+_SETUP_METHODS = frozenset(("GET", "DELETE", "PUT", "PATCH"))
+
+
+@dataclass(slots=True)
 class ResourceRequirement:
     """Represents a resource that must be created before a test can run."""
 
@@ -26,7 +33,7 @@ class ResourceRequirement:
     id_field: str = "id"  # Field name in response containing the resource ID
 
 
-@dataclass
+@dataclass(slots=True)
 class TestAnalysis:
     """Analysis result for a single operation's tests."""
 
@@ -53,34 +60,49 @@ class StaticTestAnalyzer:
     def __init__(self, ir: dict, payloads: List[Dict]):
         self.ir = ir
         self.payloads = payloads
-        self.ops_map = {op["id"]: op for op in ir.get("operations", [])}
         self._build_create_operations_map()
 
     def _build_create_operations_map(self) -> None:
         """
         Build a map of resource types to their create operations.
         This helps us know how to create prerequisite resources.
+
+        The same pass indexes each operation's normalized method, path and
+        path params so `analyze_operation` does no per-call re-derivation.
         """
+        self.ops_map: Dict[str, Dict] = {}
         self.create_ops: Dict[str, Dict] = {}
+        self._method_by_id: Dict[str, str] = {}
+        self._path_by_id: Dict[str, str] = {}
+        self._path_params_by_id: Dict[str, List[Dict]] = {}
+        self._resource_for_param: Dict[str, str] = {}
 
         for op in self.ir.get("operations", []):
+            op_id = op["id"]
             method = op.get("method", "").upper()
             path = op.get("path", "")
 
+            self.ops_map[op_id] = op
+            self._method_by_id[op_id] = method
+            self._path_by_id[op_id] = path
+            self._path_params_by_id[op_id] = self._get_path_params(op)
+
             # POST to a collection endpoint is a create operation
             if method == "POST":
                 # Extract resource type from path (e.g., "/users" -> "user", "/transfers" -> "transfer")
                 resource_type = self._extract_resource_type(path)
                 if resource_type:
                     self.create_ops[resource_type] = {
-                        "operation_id": op["id"],
+                        "operation_id": op_id,
                         "path": path,
                         "method": method,
                         "inputs": op.get("inputs", {}),
                         "schema": self._get_body_schema(op),
                     }
 
-    def _extract_resource_type(self, path: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _extract_resource_type(path: str) -> str:
         """
         Extract resource type from path.
         E.g., "/users" -> "user", "/api/v1/transfers" -> "transfer"
@@ -90,12 +112,10 @@ class StaticTestAnalyzer:
 
         # Find the last non-parameterized segment
         for part in reversed(parts):
-            if not part.startswith("{"):
-                # Singularize (basic: remove trailing 's')
-                resource = (
-                    part.rstrip("s") if part.endswith("s") and len(part) > 1 else part
-                )
-                return resource
+            if not part or part[0] == "{":
+                continue
+            # Singularize (basic: remove a single trailing 's')
+            return part[:-1] if len(part) > 1 and part[-1] == "s" else part
         return ""
 
     def _get_body_schema(self, op: Dict) -> Dict:
@@ -107,16 +127,13 @@ class StaticTestAnalyzer:
         """Get path parameters from operation."""
         return op.get("inputs", {}).get("path", [])
 
-    def _infer_create_endpoint(self, path: str, path_params: List[Dict]) -> str:
+    def _infer_create_endpoint(self, path: str) -> str:
         """
         Infer the create endpoint from a GET/DELETE endpoint.
         E.g., "/users/{user_id}" -> "/users"
         """
-        # Remove all path parameter placeholders
-        result = path
-        for param in path_params:
-            param_name = param.get("name", "")
-            result = result.replace(f"/{{{param_name}}}", "")
+        # Remove all path parameter placeholders in a single pass
+        result = _PATH_PARAM_RE.sub("", path)
         return result if result else "/"
 
     def _infer_resource_type_from_param(self, param_name: str) -> str:
@@ -132,8 +149,8 @@ class StaticTestAnalyzer:
         """
         Analyze a single operation to determine if it needs test data setup.
         """
-        op = self.ops_map.get(operation_id)
-        if not op:
+        method = self._method_by_id.get(operation_id)
+        if method is None:
             return TestAnalysis(
                 operation_id=operation_id,
                 method="",
@@ -141,50 +158,61 @@ class StaticTestAnalyzer:
                 needs_setup=False,
             )
 
-        method = op.get("method", "").upper()
-        path = op.get("path", "")
-        path_params = self._get_path_params(op)
-
-        analysis = TestAnalysis(
-            operation_id=operation_id,
-            method=method,
-            path=path,
-            needs_setup=False,
-            resource_requirements=[],
-            create_operations={},
-        )
+        path = self._path_by_id[operation_id]
+        path_params = self._path_params_by_id[operation_id]
 
-        # Determine if setup is needed
-        needs_setup = False
+        # Fast path: only GET/DELETE/PUT/PATCH with path params need setup
+        if method not in _SETUP_METHODS or not path_params:
+            logger.debug(
+                "analyze_operation: %s %s needs_setup=False resources=0",
+                operation_id,
+                path,
+            )
+            return TestAnalysis(
+                operation_id=operation_id,
+                method=method,
+                path=path,
+                needs_setup=False,
+            )
 
-        if method in ("GET", "DELETE", "PUT", "PATCH") and path_params:
-            needs_setup = True
+        create_endpoint = self._infer_create_endpoint(path)
+        resource_requirements: List[ResourceRequirement] = []
+        create_operations: Dict[str, Dict] = {}
 
-            for param in path_params:
-                param_name = param.get("name", "")
+        for param in path_params:
+            param_name = param.get("name", "")
+            resource_type = self._resource_for_param.get(param_name)
+            if resource_type is None:
                 resource_type = self._infer_resource_type_from_param(param_name)
-                create_endpoint = self._infer_create_endpoint(path, path_params)
-
-                # Find the create operation for this resource type
-                create_op = self.create_ops.get(resource_type, {})
-
-                requirement = ResourceRequirement(
-                    resource_type=resource_type,
-                    endpoint=create_op.get("path", create_endpoint),
-                    param_name=param_name,
-                    schema=create_op.get("schema", {}),
-                    required_fields=self._extract_required_fields(
-                        create_op.get("schema", {})
-                    ),
-                    id_field="id",
-                )
+                self._resource_for_param[param_name] = resource_type
+
+            # Find the create operation for this resource type
+            create_op = self.create_ops.get(resource_type, {})
+
+            requirement = ResourceRequirement(
+                resource_type=resource_type,
+                endpoint=create_op.get("path", create_endpoint),
+                param_name=param_name,
+                schema=create_op.get("schema", {}),
+                required_fields=self._extract_required_fields(
+                    create_op.get("schema", {})
+                ),
+                id_field="id",
+            )
 
-                analysis.resource_requirements.append(requirement)
+            resource_requirements.append(requirement)
 
-                if create_op:
-                    analysis.create_operations[resource_type] = create_op
+            if create_op:
+                create_operations[resource_type] = create_op
 
-        analysis.needs_setup = needs_setup
+        analysis = TestAnalysis(
+            operation_id=operation_id,
+            method=method,
+            path=path,
+            needs_setup=True,
+            resource_requirements=resource_requirements,
+            create_operations=create_operations,
+        )
         logger.debug(
             "analyze_operation: %s %s needs_setup=%s resources=%d",
             operation_id,
@@ -200,10 +228,7 @@ class StaticTestAnalyzer:
 
     def analyze_all(self) -> Dict[str, TestAnalysis]:
         """Analyze all operations and return a map of operation_id to analysis."""
-        results = {}
-        for op_id in self.ops_map.keys():
-            results[op_id] = self.analyze_operation(op_id)
-        return results
+        return {op_id: self.analyze_operation(op_id) for op_id in self._method_by_id}
 
     def get_happy_path_payload(self, operation_id: str) -> Dict:
         """
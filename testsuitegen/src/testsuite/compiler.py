@@ -10,6 +10,20 @@ import json
 
 from testsuitegen.src.testsuite.planner import SetupPlan, SetupStep, TeardownStep
 
+# Fixture for operations that need no prerequisite resources (plan-independent)
+EMPTY_FIXTURE = '''@pytest.fixture(scope="module")
+def test_data_setup(api_client):
+    """No prerequisite resources needed for this test."""
+    yield {"created_resources": [], "placeholders": {}}'''
+
+# Test-body path_params normalization used instead of placeholder resolution
+# when an operation has no setup
+NO_PLACEHOLDER_RESOLUTION = """    # No placeholder resolution needed for this operation
+    if path_params is None:
+        path_params = {}
+    if not isinstance(path_params, dict):
+        path_params = dict(path_params)"""
+
 
 class FixtureCompiler:
     """
@@ -62,10 +76,7 @@ class FixtureCompiler:
 
     def _compile_empty_fixture(self) -> str:
         """Generate a minimal fixture when no setup is needed."""
-        return '''@pytest.fixture(scope="module")
-def test_data_setup(api_client):
-    """No prerequisite resources needed for this test."""
-    yield {"created_resources": [], "placeholders": {}}'''
+        return EMPTY_FIXTURE
 
     def _compile_setup_step(self, step: SetupStep) -> List[str]:
         """Compile a single setup step into Python code."""
@@ -1,39 +1,394 @@
+import asyncio
+import functools
+import json
 import os
-import pprint
-from collections import defaultdict
-from typing import List, Dict
-from jinja2 import Template
-from testsuitegen.src.llm_enhancer.python_enhancer.test_suite_enhancer.enhancer import (
-    enhance_code as enhance_code_python,
-)
-from testsuitegen.src.llm_enhancer.typescript_enhancer.test_suite_enhancer.enhancer import (
-    enhance_code as enhance_code_ts,
-)
+import re
+import subprocess
+import threading
+from itertools import islice
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, List, Dict, Optional, Tuple
+from jinja2 import DictLoader, Environment, FileSystemBytecodeCache, Template
 from testsuitegen.src.testsuite.templates import (
     UNIT_TEST_TEMPLATE,
     API_TEST_TEMPLATE,
     OPENAPI_JEST_TEST_TEMPLATE,
     TYPESCRIPT_FUNCTION_TEST_TEMPLATE,
 )
-from testsuitegen.src.testsuite.analyzer import StaticTestAnalyzer
-from testsuitegen.src.testsuite.planner import SetupPlanner
-from testsuitegen.src.testsuite.compiler import FixtureCompiler
+from testsuitegen.src.testsuite.analyzer import StaticTestAnalyzer, TestAnalysis
+from testsuitegen.src.testsuite.planner import SetupPlan, SetupPlanner
+from testsuitegen.src.testsuite.compiler import (
+    EMPTY_FIXTURE,
+    NO_PLACEHOLDER_RESOLUTION,
+    FixtureCompiler,
+)
 
 import logging
 
 logger = logging.getLogger(__name__)
 
 
-def _format_payload(payload: dict, indent: int = 8) -> str:
+def _make_jinja_env() -> Environment:
+    """
+    Shared environment for the static test templates.
+
+    Compiled template code is persisted by a FileSystemBytecodeCache (in
+    Jinja's per-user temp directory), so warm runs skip compilation. Falls
+    back to no bytecode cache when that directory cannot be used.
+    """
+    try:
+        bytecode_cache = FileSystemBytecodeCache()
+    except (OSError, RuntimeError) as e:
+        logger.debug("jinja: bytecode cache unavailable: %s", e)
+        bytecode_cache = None
+    return Environment(
+        loader=DictLoader(
+            {
+                "unit": UNIT_TEST_TEMPLATE,
+                "ts": TYPESCRIPT_FUNCTION_TEST_TEMPLATE,
+                "api": API_TEST_TEMPLATE,
+                "jest": OPENAPI_JEST_TEST_TEMPLATE,
+            }
+        ),
+        auto_reload=False,
+        bytecode_cache=bytecode_cache,
+    )
+
+
+# Templates are static, so load each one once per process (through one shared
+# environment) instead of per operation
+_JINJA_ENV = _make_jinja_env()
+_UNIT_TMPL = _JINJA_ENV.get_template("unit")
+_TS_TMPL = _JINJA_ENV.get_template("ts")
+_API_TMPL = _JINJA_ENV.get_template("api")
+_JEST_TMPL = _JINJA_ENV.get_template("jest")
+
+
+# Layout of payload literals embedded in generated tests
+_PAYLOAD_WIDTH = 80
+_PAYLOAD_STEP = 4
+
+# '__ENUM__Priority.HIGH__' payload markers, emitted as bare enum references
+_ENUM_MARKER_RE = re.compile(r"__ENUM__([A-Za-z_][A-Za-z0-9_.]+)__")
+_STR_WORDS_RE = re.compile(r"\S*\s*")
+
+
+def _str_lines(value: str, indent: int, column: int) -> List[str]:
+    """
+    Python literal lines for a string. Strings that overflow the payload
+    width are wrapped at whitespace into a parenthesized implicit
+    concatenation, so long text stays readable.
+
+    The value is the same as pprint's, but the breaks are not: chunks are
+    sized for the payload's own indent rather than pprint's hanging one, so
+    long multi-word strings wrap at different words than pformat did.
+    """
+    rep = repr(value)
+    if column + len(rep) < _PAYLOAD_WIDTH:
+        return [rep]
+
+    max_width = _PAYLOAD_WIDTH - indent - _PAYLOAD_STEP
+    chunks = []
+    for line in value.splitlines(True):
+        current = ""
+        for word in _STR_WORDS_RE.findall(line):
+            candidate = current + word
+            if current and len(repr(candidate)) > max_width:
+                chunks.append(repr(current))
+                current = word
+            else:
+                current = candidate
+        if current:
+            chunks.append(repr(current))
+
+    if len(chunks) <= 1:
+        return [rep]
+    pad = " " * _PAYLOAD_STEP
+    return ["(", *(pad + chunk for chunk in chunks), ")"]
+
+
+def _payload_lines(value, enums: bool, indent: int, column: int) -> List[str]:
+    """
+    Python literal lines for `value`, built in one bottom-up walk.
+
+    `indent` is the indentation of the line `value` starts on and `column`
+    the position of its first character; continuation lines are relative to
+    `indent`. Containers stay on one line when they fit in _PAYLOAD_WIDTH,
+    otherwise they put one entry per line. Dict keys are sorted.
+    """
+    if isinstance(value, str):
+        if enums:
+            match = _ENUM_MARKER_RE.fullmatch(value)
+            if match:
+                return [match.group(1)]
+        return _str_lines(value, indent, column)
+
+    if isinstance(value, dict):
+        try:
+            items = sorted(value.items())
+        except TypeError:
+            # Mixed-type keys: order by type name first, as pprint does
+            items = sorted(
+                value.items(), key=lambda kv: (type(kv[0]).__name__, repr(kv[0]))
+            )
+        child_indent = indent + _PAYLOAD_STEP
+        entries = []
+        for key, item in items:
+            match = enums and isinstance(key, str) and _ENUM_MARKER_RE.fullmatch(key)
+            key_rep = match.group(1) if match else repr(key)
+            prefix = key_rep + ": "
+            entries.append(
+                (
+                    prefix,
+                    _payload_lines(
+                        item, enums, child_indent, child_indent + len(prefix)
+                    ),
+                )
+            )
+        open_, close, trailer = "{", "}", ""
+    elif isinstance(value, (list, tuple)):
+        child_indent = indent + _PAYLOAD_STEP
+        entries = [
+            ("", _payload_lines(item, enums, child_indent, child_indent))
+            for item in value
+        ]
+        if isinstance(value, list):
+            open_, close, trailer = "[", "]", ""
+        else:
+            open_, close, trailer = "(", ")", "," if len(value) == 1 else ""
+    else:
+        return [repr(value)]
+
+    if all(len(lines) == 1 for _, lines in entries):
+        flat = (
+            open_
+            + ", ".join(prefix + lines[0] for prefix, lines in entries)
+            + trailer
+            + close
+        )
+        # +1 leaves room for a trailing comma after the value
+        if column + len(flat) + 1 <= _PAYLOAD_WIDTH:
+            return [flat]
+
+    if not entries:
+        # An empty container is always written inline, even past the width
+        return [open_ + close]
+
+    pad = " " * _PAYLOAD_STEP
+    out = [open_]
+    for prefix, lines in entries:
+        out.append(pad + prefix + lines[0])
+        out.extend(pad + line for line in lines[1:])
+        out[-1] += ","
+    # No trailing comma after the last entry (black would treat it as
+    # "magic" and keep the container exploded)
+    out[-1] = out[-1][:-1] + trailer
+    out.append(close)
+    return out
+
+
+def _format_payload(payload: dict, indent: int = 8, enums: bool = False) -> str:
     """Format a payload dict for embedding in test code.
 
-    Uses pprint to handle long strings properly with line wrapping.
+    Long containers are split one entry per line and long strings are
+    wrapped at whitespace. With `enums`, __ENUM__Type.MEMBER__ markers are
+    emitted as bare enum references (Type.MEMBER) instead of strings.
+    """
+    lines = _payload_lines(payload, enums, 0, 0)
+    # Add proper indentation for embedding in test code: one join with the
+    # padded separator, no per-line concatenation
+    return ("\n" + " " * indent).join(lines)
+
+
+@dataclass(frozen=True, slots=True)
+class _ApiPrep:
     """
-    formatted = pprint.pformat(payload, width=80, indent=4)
-    # Add proper indentation for embedding in test code
-    lines = formatted.split("\n")
-    indented_lines = [lines[0]] + [" " * indent + line for line in lines[1:]]
-    return "\n".join(indented_lines)
+    Preprocessed (IR, payloads) shared by the pytest and Jest API generators.
+
+    Per-operation fields are stored as parallel tuples (struct-of-arrays),
+    aligned with `op_ids`: only operations that have payloads and exist in
+    the IR, in payload grouping order.
+    """
+
+    ir: dict
+    payloads: List[Dict]
+    payload_count: int
+    ops_map: Dict[str, Dict]
+    op_ids: Tuple[str, ...]
+    cases: Tuple[List[Dict], ...]
+    # Per case: intent is HAPPY_PATH (normalized once, aligned with `cases`)
+    happy_path: Tuple[Tuple[bool, ...], ...]
+    paths: Tuple[str, ...]
+    methods: Tuple[str, ...]  # as written in the IR
+    upper_methods: Tuple[str, ...]
+    error_codes: Tuple[List[int], ...]
+    error_info: Tuple[List[Dict], ...]
+    path_param_names: Tuple[List[str], ...]
+    query_param_names: Tuple[List[str], ...]
+    body_props: Tuple[List[str], ...]
+    # Static analysis and setup plans depend only on (IR, payloads); plans are
+    # aligned with `op_ids` (None when the operation has no analysis)
+    all_analyses: Dict[str, TestAnalysis]
+    setup_plans: Tuple[Optional[SetupPlan], ...]
+
+
+# beforeAll block creating one prerequisite resource (see _compile_jest_setup)
+_JEST_SETUP_STEP = """\
+    // Create {resource_type} resource
+    const createPayload_{resource_type} = {payload};
+    const createRes_{resource_type} = await fetch(`${{BASE_URL}}{endpoint}`, {{
+      method: 'POST',
+      headers: {{ 'Content-Type': 'application/json' }},
+      body: JSON.stringify(createPayload_{resource_type}),
+    }});
+    if (createRes_{resource_type}.ok) {{
+      const data: any = await createRes_{resource_type}.json();
+      createdResources.push({{ type: '{resource_type}', id: data.id, endpoint: `${{BASE_URL}}{endpoint}/${{data.id}}` }});
+      placeholders['USE_CREATED_RESOURCE'] = data.id;
+      placeholders['USE_CREATED_RESOURCE_{resource_type_upper}'] = data.id;
+    }}
+"""
+
+# afterAll block deleting created resources; independent of the plan
+_JEST_TEARDOWN = """\
+    for (const resource of createdResources.reverse()) {
+      try {
+        await fetch(resource.endpoint, { method: 'DELETE' });
+      } catch (e) {
+        console.warn(`Cleanup failed for ${resource.type} ${resource.id}`);
+      }
+    }"""
+
+# Jest project files written next to the API Jest tests. They are static, so
+# they are serialized once at import (see _write_jest_config_files).
+_JEST_CONFIG_FILES = (
+    # package.json with ts-jest and TypeScript dependencies
+    # Uses native fetch (Node.js 18+) so no node-fetch dependency needed
+    (
+        "package.json",
+        json.dumps(
+            {
+                "name": "testsuitegen-api-tests",
+                "version": "1.0.0",
+                "description": "Auto-generated API tests by TestSuiteGen",
+                "scripts": {
+                    "test": "jest --detectOpenHandles",
+                    "test:verbose": "jest --verbose --detectOpenHandles",
+                },
+                "devDependencies": {
+                    "@types/jest": "^29.5.14",
+                    "@types/node": "^22.10.5",
+                    "jest": "^29.7.0",
+                    "ts-jest": "^29.2.5",
+                    "typescript": "^5.7.2",
+                },
+            },
+            indent=2,
+        ).encode(),
+    ),
+    # jest.config.js with ts-jest preset
+    (
+        "jest.config.js",
+        b"""/** @type {import('ts-jest').JestConfigWithTsJest} */
+module.exports = {
+  preset: 'ts-jest',
+  testEnvironment: 'node',
+  testMatch: ['**/*.test.ts'],
+  moduleFileExtensions: ['ts', 'js', 'json'],
+  transform: {
+    '^.+\\.ts$': 'ts-jest',
+  },
+  testTimeout: 30000,
+  verbose: true,
+};
+""",
+    ),
+    # tsconfig.json for TypeScript configuration
+    (
+        "tsconfig.json",
+        json.dumps(
+            {
+                "compilerOptions": {
+                    "target": "ES2020",
+                    "module": "commonjs",
+                    "lib": ["ES2020"],
+                    "strict": True,
+                    "esModuleInterop": True,
+                    "skipLibCheck": True,
+                    "forceConsistentCasingInFileNames": True,
+                    "resolveJsonModule": True,
+                    "declaration": False,
+                    "outDir": "./dist",
+                    "rootDir": ".",
+                },
+                "include": ["**/*.ts"],
+                "exclude": ["node_modules", "dist"],
+            },
+            indent=2,
+        ).encode(),
+    ),
+)
+
+# Per-operation render/write threads (I/O-bound; see _run_per_operation)
+_RENDER_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Upper bound on in-flight LLM enhancement requests (provider rate limits)
+_LLM_MAX_CONCURRENCY = 8
+
+
+@dataclass(frozen=True, slots=True)
+class _PendingEnhancement:
+    """A rendered file buffered until finalize() runs the LLM polisher."""
+
+    filepath: str
+    content: str
+    test_type: str
+    framework: str
+
+
+# Methods whose HAPPY_PATH cases target a previously created resource
+_METHODS_WITH_PATH_PARAMS = frozenset(("GET", "DELETE", "PUT", "PATCH"))
+
+
+@dataclass(frozen=True, slots=True)
+class _ApiGenCtx:
+    """Invariants of one generate_api_tests call, shared by all operations."""
+
+    base_url: str
+    fixture_compiler: FixtureCompiler
+    placeholder_resolution: str
+
+
+def _write_bytes(path: str, data: bytes) -> None:
+    """Write `data` to `path` with raw os.write calls (no TextIOWrapper)."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            # A single call for regular files; loop covers short writes
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
+@functools.lru_cache(maxsize=1024)
+def _summarize_schema_shape(
+    schema_type: str, prop_names: tuple, prop_count: int, items_type
+) -> str:
+    """Summary text for a schema reduced to its hashable shape."""
+    if schema_type == "object":
+        if prop_count:
+            prop_str = ", ".join(prop_names)
+            if prop_count > 3:
+                prop_str += ", ..."
+            return f"object with properties: {prop_str}"
+        return "object"
+    elif schema_type == "array":
+        return f"array of {items_type}"
+    else:
+        return schema_type
 
 
 class TestSuiteGenerator:
@@ -46,7 +401,27 @@ class TestSuiteGenerator:
         self.output_dir = output_dir
         self.llm_provider = llm_provider
         self.llm_model = llm_model
+        # Guards disabling the LLM from concurrent per-operation workers
+        self._llm_lock = threading.Lock()
+        # Python files awaiting a single batched black run (see finalize)
+        self._pending_format: List[str] = []
+        # Files awaiting concurrent LLM enhancement (see finalize)
+        self._pending_enhance: List[_PendingEnhancement] = []
+        # Last (payloads, len(payloads), grouped) from _group_by_operation
+        self._grouped_cache: Optional[Tuple[List[Dict], int, Dict[str, List[Dict]]]] = (
+            None
+        )
+        # Last API preprocessing result (see _prepare_api_context)
+        self._api_prep: Optional[_ApiPrep] = None
+        # id(errors) -> (errors, error_info) (see _build_error_info)
+        self._error_info_cache: Dict[int, Tuple[List[Dict], List[Dict]]] = {}
+        # id(schema) -> (schema, summary) (see _schema_summary)
+        self._schema_summary_cache: Dict[int, Tuple[dict, str]] = {}
+        # id(payload) -> (payload, json) (see _payload_json)
+        self._payload_json_cache: Dict[int, Tuple[dict, str]] = {}
         os.makedirs(self.output_dir, exist_ok=True)
+        # Directories already created by this generator (skips repeat makedirs)
+        self._created_dirs = {self.output_dir}
 
     def generate_python_unit_tests(
         self, ir: dict, payloads: List[Dict], module_name: str
@@ -57,10 +432,9 @@ class TestSuiteGenerator:
         grouped = self._group_by_operation(payloads)
 
         # Build a map of operation_id -> enum info from IR
-        ops_enum_types = self._extract_enum_types_from_ir(ir)
-        ops_enum_conversions = self._extract_enum_conversions_from_ir(ir)
+        ops_enum_types, ops_enum_conversions = self._extract_enum_metadata_from_ir(ir)
 
-        for op_id, cases in grouped.items():
+        def _render_one(op_id: str, cases: List[Dict]) -> None:
             # Get enum types used by this operation
             enum_types = ops_enum_types.get(op_id, [])
             enum_conversions = ops_enum_conversions.get(op_id, {})
@@ -69,14 +443,13 @@ class TestSuiteGenerator:
             formatted_cases = []
             for case in cases:
                 formatted_case = dict(case)
-                formatted_case["payload_formatted"] = self._format_payload_with_enums(
-                    case.get("payload", {})
+                formatted_case["payload_formatted"] = _format_payload(
+                    case.get("payload", {}), indent=12, enums=True
                 )
                 formatted_cases.append(formatted_case)
 
             # Render with all test cases (Happy Path + Edge Cases)
-            template = Template(UNIT_TEST_TEMPLATE)
-            code = template.render(
+            code = _UNIT_TMPL.render(
                 module_path=module_name,
                 function_name=op_id,
                 operation_id=op_id,
@@ -87,6 +460,9 @@ class TestSuiteGenerator:
 
             self._write_file("unit", f"test_{op_id}.py", code, test_type="unit")
 
+        self._run_per_operation(_render_one, grouped.keys(), grouped.values())
+        self.finalize()
+
     def generate_typescript_tests(self, ir: dict, payloads: List[Dict]):
         """
         Generates unit tests for TypeScript functions.
@@ -95,18 +471,23 @@ class TestSuiteGenerator:
         # Import path relative to tests/ folder - tests are in tests/ so we need ../src/
         module_path = "../src/validator"
 
-        for op_id, cases in grouped.items():
-            template = Template(TYPESCRIPT_FUNCTION_TEST_TEMPLATE)
-            code = template.render(
-                module_path=module_path,
-                function_name=op_id,
-                operation_id=op_id,
-                test_cases=cases,
+        def _render_one(op_id: str, cases: List[Dict]) -> None:
+            self._write_rendered(
+                "tests_ts",
+                f"{op_id}.test.ts",
+                _TS_TMPL,
+                {
+                    "module_path": module_path,
+                    "function_name": op_id,
+                    "operation_id": op_id,
+                    "test_cases": cases,
+                },
+                test_type="unit",
+                framework="jest",
             )
 
-            self._write_file(
-                "tests_ts", f"{op_id}.test.ts", code, test_type="unit", framework="jest"
-            )
+        self._run_per_operation(_render_one, grouped.keys(), grouped.values())
+        self.finalize()
 
     def generate_api_tests(
         self, ir: dict, payloads: List[Dict], base_url: str = "http://localhost:8000"
@@ -123,124 +504,98 @@ class TestSuiteGenerator:
         # Ensure base_url is a string and strip trailing slash for consistency
         base_url = str(base_url).rstrip("/")
 
-        grouped = self._group_by_operation(payloads)
-
-        # We need to look up path/method from the IR for each operation
-        ops_map = {op["id"]: op for op in ir["operations"]}
+        # Grouped payloads and per-operation IR fields (shared with the Jest generator)
+        prep = self._prepare_api_context(ir, payloads)
 
         # === NEW PIPELINE ===
 
-        # Step 1: Static Analysis - analyze all operations
-        logger.debug("pipeline: running StaticTestAnalyzer")
-        analyzer = StaticTestAnalyzer(ir, payloads)
-        all_analyses = analyzer.analyze_all()
-
-        # Step 2: Setup Planner - plan setup for each operation
-        logger.debug("pipeline: initializing SetupPlanner")
-        planner = SetupPlanner(payloads)
+        # Steps 1-2: Static Analysis and Setup Planner run once per (IR, payloads)
+        # in _prepare_api_context
 
         # Step 3: Fixture Compiler - compile fixtures
         logger.debug("pipeline: initializing FixtureCompiler (base_url=%s)", base_url)
         fixture_compiler = FixtureCompiler(base_url)
 
-        logger.debug(
-            "pipeline: beginning per-operation rendering for %d operations",
-            len(grouped),
+        # Per-call invariants, resolved once for every operation
+        ctx = _ApiGenCtx(
+            base_url=base_url,
+            fixture_compiler=fixture_compiler,
+            placeholder_resolution=fixture_compiler.compile_placeholder_resolution(),
         )
-        for op_id, cases in grouped.items():
-            op_details = ops_map.get(op_id)
-            if not op_details:
-                logger.debug("operation: %s not found in IR — skipping", op_id)
-                continue
 
-            # Get analysis and plan for this operation
-            analysis = all_analyses.get(op_id)
-            logger.debug("operation: %s analysis found=%s", op_id, bool(analysis))
-            setup_plan = planner.plan(analysis, all_analyses) if analysis else None
+        # Resolved once so per-operation debug logging costs one bool check
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug(
+                "pipeline: beginning per-operation rendering for %d operations",
+                len(prep.op_ids),
+            )
+
+        def _render_one(i: int) -> None:
+            op_id = prep.op_ids[i]
+            cases = prep.cases[i]
+
+            # Precomputed plan for this operation
+            setup_plan = prep.setup_plans[i]
+            if debug:
+                logger.debug(
+                    "operation: %s analysis found=%s",
+                    op_id,
+                    op_id in prep.all_analyses,
+                )
 
             # Compile the fixture code
             if setup_plan and setup_plan.needs_setup:
-                compiled_fixture = fixture_compiler.compile(setup_plan)
-                placeholder_resolution = (
-                    fixture_compiler.compile_placeholder_resolution()
-                )
+                compiled_fixture = ctx.fixture_compiler.compile(setup_plan)
+                placeholder_resolution = ctx.placeholder_resolution
             else:
-                compiled_fixture = fixture_compiler._compile_empty_fixture()
-                placeholder_resolution = """    # No placeholder resolution needed for this operation
-    if path_params is None:
-        path_params = {}
-    if not isinstance(path_params, dict):
-        path_params = dict(path_params)"""
-
-            # Extract error information
-            errors = op_details.get("errors", [])
-            error_codes = [e["status"] for e in errors]
-            error_info = []
-            for error in errors:
-                error_data = {
-                    "status": error["status"],
-                    "description": error.get("description", "Error"),
-                    "schema": error.get("schema"),
-                }
-                # Create a simplified schema summary for documentation
-                if error.get("schema"):
-                    error_data["schema_summary"] = self._summarize_schema(
-                        error["schema"]
-                    )
-                error_info.append(error_data)
-
-            # Extract path parameter names from operation inputs
-            path_param_names = [
-                p["name"] for p in op_details.get("inputs", {}).get("path", [])
-            ]
-
-            # Extract query parameter names
-            query_param_names = [
-                p["name"] for p in op_details.get("inputs", {}).get("query", [])
-            ]
-
-            # Extract body property names
-            body_props = []
-            body = op_details.get("inputs", {}).get("body", {})
-            if body and body.get("schema"):
-                body_props = list(body["schema"].get("properties", {}).keys())
-
-            # Patch cases with USE_CREATED_RESOURCE for GET with path params
-            method = op_details["method"].upper()
-            has_path_params = bool(path_param_names)
+                compiled_fixture = EMPTY_FIXTURE
+                placeholder_resolution = NO_PLACEHOLDER_RESOLUTION
+
+            path_param_names = prep.path_param_names[i]
+
+            # Patch cases with USE_CREATED_RESOURCE for GET with path params and
+            # pre-format payloads and path_params for proper embedding, building
+            # each template-facing case in a single dict allocation
+            placeholder_pp = self._created_resource_path_params(
+                prep.upper_methods[i], path_param_names
+            )
+            if placeholder_pp is not None:
+                placeholder_pp_formatted = _format_payload(placeholder_pp)
             patched_cases = []
-            for case in cases:
-                patched_case = dict(case)
-                if (
-                    method in ("GET", "DELETE", "PUT", "PATCH")
-                    and has_path_params
-                    and case.get("intent", "").upper() == "HAPPY_PATH"
-                ):
-                    # Patch path_params to use a placeholder for created resource
-                    patched_case["path_params"] = {
-                        k: "USE_CREATED_RESOURCE" for k in path_param_names
-                    }
-                # Pre-format payloads and path_params for proper embedding
-                patched_case["payload_formatted"] = _format_payload(
-                    patched_case.get("payload", {})
-                )
-                patched_case["path_params_formatted"] = _format_payload(
-                    patched_case.get("path_params", {})
-                )
-                patched_cases.append(patched_case)
+            for case, happy_path in zip(cases, prep.happy_path[i]):
+                payload_formatted = _format_payload(case.get("payload", {}))
+                if placeholder_pp is not None and happy_path:
+                    patched_cases.append(
+                        {
+                            **case,
+                            "path_params": placeholder_pp,
+                            "payload_formatted": payload_formatted,
+                            "path_params_formatted": placeholder_pp_formatted,
+                        }
+                    )
+                else:
+                    patched_cases.append(
+                        {
+                            **case,
+                            "payload_formatted": payload_formatted,
+                            "path_params_formatted": _format_payload(
+                                case.get("path_params", {})
+                            ),
+                        }
+                    )
 
-            template = Template(API_TEST_TEMPLATE)
-            code = template.render(
-                base_url=base_url,
-                path=op_details["path"],
-                method=op_details["method"],
+            code = _API_TMPL.render(
+                base_url=ctx.base_url,
+                path=prep.paths[i],
+                method=prep.methods[i],
                 operation_id=op_id,
                 test_cases=patched_cases,
-                error_codes=error_codes,
-                error_info=error_info,
+                error_codes=prep.error_codes[i],
+                error_info=prep.error_info[i],
                 path_param_names=path_param_names,
-                query_param_names=query_param_names,
-                body_props=body_props,
+                query_param_names=prep.query_param_names[i],
+                body_props=prep.body_props[i],
                 compiled_fixture=compiled_fixture,
                 placeholder_resolution=placeholder_resolution,
             )
@@ -248,6 +603,9 @@ class TestSuiteGenerator:
             # Write file - LLM is now optional polisher only
             self._write_file("api", f"test_api_{op_id}.py", code, test_type="api")
 
+        self._run_per_operation(_render_one, range(len(prep.op_ids)))
+        self.finalize()
+
     def generate_api_tests_jest(
         self, ir: dict, payloads: List[Dict], base_url: str = "http://localhost:8000"
     ):
@@ -262,26 +620,17 @@ class TestSuiteGenerator:
         # Ensure base_url is a string and strip trailing slash for consistency
         base_url = str(base_url).rstrip("/")
 
-        grouped = self._group_by_operation(payloads)
-
-        ops_map = {op["id"]: op for op in ir["operations"]}
+        prep = self._prepare_api_context(ir, payloads)
 
         # === NEW PIPELINE (same as pytest) ===
-        # Step 1: Static Analysis
-        analyzer = StaticTestAnalyzer(ir, payloads)
-        all_analyses = analyzer.analyze_all()
+        # Steps 1-2: Static Analysis and Setup Planner (cached with prep)
 
-        # Step 2: Setup Planner
-        planner = SetupPlanner(payloads)
+        def _render_one(i: int) -> None:
+            op_id = prep.op_ids[i]
+            cases = prep.cases[i]
 
-        for op_id, cases in grouped.items():
-            op_details = ops_map.get(op_id)
-            if not op_details:
-                continue
-
-            # Get analysis and plan for this operation
-            analysis = all_analyses.get(op_id)
-            setup_plan = planner.plan(analysis, all_analyses) if analysis else None
+            # Precomputed plan for this operation
+            setup_plan = prep.setup_plans[i]
 
             # Compile the setup code for Jest (beforeAll/afterAll)
             needs_setup = setup_plan and setup_plan.needs_setup
@@ -293,126 +642,248 @@ class TestSuiteGenerator:
                     setup_plan, base_url
                 )
 
-            # Extract path parameter names
-            path_param_names = [
-                p["name"] for p in op_details.get("inputs", {}).get("path", [])
-            ]
+            path_param_names = prep.path_param_names[i]
 
             # Patch cases with USE_CREATED_RESOURCE for GET/DELETE/PUT/PATCH
-            method = op_details["method"].upper()
-            has_path_params = bool(path_param_names)
-            patched_cases = []
-            for case in cases:
-                patched_case = dict(case)
-                if (
-                    method in ("GET", "DELETE", "PUT", "PATCH")
-                    and has_path_params
-                    and case.get("intent", "").upper() == "HAPPY_PATH"
-                ):
-                    patched_case["path_params"] = {
-                        k: "USE_CREATED_RESOURCE" for k in path_param_names
-                    }
-                patched_cases.append(patched_case)
-
-            errors = op_details.get("errors", [])
-            error_codes = [e["status"] for e in errors]
-            error_info = []
-            for error in errors:
-                error_data = {
-                    "status": error["status"],
-                    "description": error.get("description", "Error"),
-                    "schema": error.get("schema"),
-                }
-                if error.get("schema"):
-                    error_data["schema_summary"] = self._summarize_schema(
-                        error["schema"]
-                    )
-                error_info.append(error_data)
-
-            template = Template(OPENAPI_JEST_TEST_TEMPLATE)
-            code = template.render(
-                base_url=base_url,
-                path=op_details["path"],
-                method=op_details["method"],
-                operation_id=op_id,
-                test_cases=patched_cases,
-                error_codes=error_codes,
-                error_info=error_info,
-                needs_setup=needs_setup,
-                jest_setup_code=jest_setup_code,
-                jest_teardown_code=jest_teardown_code,
+            patched_cases = self._patch_cases(
+                prep.upper_methods[i], path_param_names, cases, prep.happy_path[i]
             )
 
-            self._write_file(
+            self._write_rendered(
                 "api_jest",
                 f"test_api_{op_id}.test.ts",
-                code,
+                _JEST_TMPL,
+                {
+                    "base_url": base_url,
+                    "path": prep.paths[i],
+                    "method": prep.methods[i],
+                    "operation_id": op_id,
+                    "test_cases": patched_cases,
+                    "error_codes": prep.error_codes[i],
+                    "error_info": prep.error_info[i],
+                    "needs_setup": needs_setup,
+                    "jest_setup_code": jest_setup_code,
+                    "jest_teardown_code": jest_teardown_code,
+                },
                 test_type="api",
                 framework="jest",
             )
 
+        self._run_per_operation(_render_one, range(len(prep.op_ids)))
+
+        self.finalize()
+
         # Generate Jest configuration files for TypeScript support
         self._write_jest_config_files()
 
-    def _compile_jest_setup(self, setup_plan, base_url: str) -> tuple:
+    def _prepare_api_context(self, ir: dict, payloads: List[Dict]) -> "_ApiPrep":
         """
-        Compile Jest beforeAll/afterAll code for resource creation.
-        Returns (setup_code, teardown_code) as strings.
+        Group payloads, extract the template-facing fields of every IR
+        operation and run static analysis/setup planning once. The result is
+        reused while the same IR and payload objects are passed in, e.g. when
+        both pytest and Jest suites are built or several base URLs are used.
         """
-        setup_lines = []
-        teardown_lines = []
+        prep = self._api_prep
+        if (
+            prep is not None
+            and prep.ir is ir
+            and prep.payloads is payloads
+            and prep.payload_count == len(payloads)
+        ):
+            return prep
 
-        for step in setup_plan.setup_steps:
-            import json
-
-            payload_str = json.dumps(step.payload)
+        ops_map = {op["id"]: op for op in ir["operations"]}
+        columns = {
+            "op_ids": [],
+            "cases": [],
+            "happy_path": [],
+            "paths": [],
+            "methods": [],
+            "upper_methods": [],
+            "error_codes": [],
+            "error_info": [],
+            "path_param_names": [],
+            "query_param_names": [],
+            "body_props": [],
+        }
+        for op_id, cases in self._group_by_operation(payloads).items():
+            op = ops_map.get(op_id)
+            if not op:
+                logger.debug("operation: %s not found in IR — skipping", op_id)
+                continue
 
-            setup_lines.append(f"    // Create {step.resource_type} resource")
-            setup_lines.append(
-                f"    const createPayload_{step.resource_type} = {payload_str};"
-            )
-            setup_lines.append(
-                f"    const createRes_{step.resource_type} = await fetch(`${{BASE_URL}}{step.endpoint}`, {{"
+            # Destructure once; empty tuples avoid allocating fresh defaults
+            inputs = op.get("inputs") or {}
+            path_in = inputs.get("path") or ()
+            query_in = inputs.get("query") or ()
+            body_in = inputs.get("body") or {}
+            body_schema = body_in.get("schema")
+            body_props = (
+                list(body_schema.get("properties") or ()) if body_schema else []
             )
-            setup_lines.append(f"      method: 'POST',")
-            setup_lines.append(
-                f"      headers: {{ 'Content-Type': 'application/json' }},"
-            )
-            setup_lines.append(
-                f"      body: JSON.stringify(createPayload_{step.resource_type}),"
-            )
-            setup_lines.append(f"    }});")
-            setup_lines.append(f"    if (createRes_{step.resource_type}.ok) {{")
-            setup_lines.append(
-                f"      const data: any = await createRes_{step.resource_type}.json();"
-            )
-            setup_lines.append(
-                f"      createdResources.push({{ type: '{step.resource_type}', id: data.id, endpoint: `${{BASE_URL}}{step.endpoint}/${{data.id}}` }});"
+            errors = op.get("errors") or ()
+
+            columns["op_ids"].append(op_id)
+            columns["cases"].append(cases)
+            columns["happy_path"].append(
+                tuple(case.get("intent", "").upper() == "HAPPY_PATH" for case in cases)
             )
-            setup_lines.append(f"      placeholders['USE_CREATED_RESOURCE'] = data.id;")
-            setup_lines.append(
-                f"      placeholders['USE_CREATED_RESOURCE_{step.resource_type.upper()}'] = data.id;"
+            columns["paths"].append(op["path"])
+            columns["methods"].append(op["method"])
+            columns["upper_methods"].append(op["method"].upper())
+            columns["error_codes"].append([e["status"] for e in errors])
+            columns["error_info"].append(self._build_error_info(errors))
+            columns["path_param_names"].append([p["name"] for p in path_in])
+            columns["query_param_names"].append([p["name"] for p in query_in])
+            columns["body_props"].append(body_props)
+
+        # Step 1: Static Analysis - analyze all operations
+        logger.debug("pipeline: running StaticTestAnalyzer")
+        all_analyses = StaticTestAnalyzer(ir, payloads).analyze_all()
+
+        # Step 2: Setup Planner - plan setup for each operation, once for both
+        # the pytest and Jest suites
+        logger.debug("pipeline: initializing SetupPlanner")
+        planner = SetupPlanner(payloads)
+        setup_plans = []
+        for op_id in columns["op_ids"]:
+            analysis = all_analyses.get(op_id)
+            setup_plans.append(
+                planner.plan(analysis, all_analyses) if analysis else None
             )
-            setup_lines.append(f"    }}")
-            setup_lines.append("")
 
-        teardown_lines.append(
-            "    for (const resource of createdResources.reverse()) {"
+        prep = _ApiPrep(
+            ir=ir,
+            payloads=payloads,
+            payload_count=len(payloads),
+            ops_map=ops_map,
+            **{name: tuple(values) for name, values in columns.items()},
+            all_analyses=all_analyses,
+            setup_plans=tuple(setup_plans),
         )
-        teardown_lines.append("      try {")
-        teardown_lines.append(
-            "        await fetch(resource.endpoint, { method: 'DELETE' });"
-        )
-        teardown_lines.append("      } catch (e) {")
-        teardown_lines.append(
-            "        console.warn(`Cleanup failed for ${resource.type} ${resource.id}`);"
+        self._api_prep = prep
+        return prep
+
+    @staticmethod
+    def _created_resource_path_params(
+        method: str, path_param_names: List[str]
+    ) -> Optional[Dict[str, str]]:
+        """
+        path_params pointing HAPPY_PATH cases at the created resource, or None
+        when the operation is not a GET/DELETE/PUT/PATCH with path params.
+        """
+        if not path_param_names or method not in _METHODS_WITH_PATH_PARAMS:
+            return None
+        return {k: "USE_CREATED_RESOURCE" for k in path_param_names}
+
+    @classmethod
+    def _patch_cases(
+        cls,
+        method: str,
+        path_param_names: List[str],
+        cases: List[Dict],
+        happy_path: Tuple[bool, ...],
+    ) -> List[Dict]:
+        """
+        Point HAPPY_PATH cases at the created resource
+        (path_params -> USE_CREATED_RESOURCE) for GET/DELETE/PUT/PATCH
+        operations with path params.
+
+        Returns `cases` itself when no patch applies; other cases are shared,
+        not copied.
+        """
+        placeholder_path_params = cls._created_resource_path_params(
+            method, path_param_names
         )
-        teardown_lines.append("      }")
-        teardown_lines.append("    }")
+        if placeholder_path_params is None:
+            return cases
+
+        return [
+            {**case, "path_params": placeholder_path_params} if is_happy else case
+            for case, is_happy in zip(cases, happy_path)
+        ]
+
+    def _build_error_info(self, errors: List[Dict]) -> List[Dict]:
+        """
+        Template-facing error entries, with a schema summary where available.
+
+        Cached per IR `errors` list, so re-preparing the same IR (e.g. pytest
+        and Jest runs with different payload lists) does not rebuild them.
+        """
+        cached = self._error_info_cache.get(id(errors))
+        # The cache holds `errors` itself, so its id cannot be reused meanwhile
+        if cached is not None and cached[0] is errors:
+            return cached[1]
+
+        error_info = []
+        for error in errors:
+            error_data = {
+                "status": error["status"],
+                "description": error.get("description", "Error"),
+                "schema": error.get("schema"),
+            }
+            # Create a simplified schema summary for documentation
+            schema = error.get("schema")
+            if schema:
+                error_data["schema_summary"] = self._schema_summary(schema)
+            error_info.append(error_data)
+        self._error_info_cache[id(errors)] = (errors, error_info)
+        return error_info
+
+    def _schema_summary(self, schema: dict) -> str:
+        """_summarize_schema, memoized per schema object (shared $ref targets)."""
+        cached = self._schema_summary_cache.get(id(schema))
+        if cached is not None and cached[0] is schema:
+            return cached[1]
+        summary = self._summarize_schema(schema)
+        self._schema_summary_cache[id(schema)] = (schema, summary)
+        return summary
+
+    def _run_per_operation(self, render_one: Callable[..., None], *iterables) -> None:
+        """
+        Run `render_one` over the zipped `iterables` (one call per operation)
+        on a thread pool.
+
+        Each operation renders and writes its own file, so the per-op work is
+        independent and file I/O overlaps across workers. LLM calls are not
+        made here (they are batched in finalize), so the pool is used even
+        when an LLM provider is configured.
+        """
+        with ThreadPoolExecutor(max_workers=_RENDER_WORKERS) as pool:
+            # Consume the iterator so worker exceptions propagate
+            for _ in pool.map(render_one, *iterables):
+                pass
 
-        return "\n".join(setup_lines), "\n".join(teardown_lines)
+    def _compile_jest_setup(self, setup_plan, base_url: str) -> tuple:
+        """
+        Compile Jest beforeAll/afterAll code for resource creation.
+        Returns (setup_code, teardown_code) as strings.
+        """
+        setup_code = "\n".join(
+            _JEST_SETUP_STEP.format(
+                resource_type=step.resource_type,
+                resource_type_upper=step.resource_type.upper(),
+                payload=self._payload_json(step.payload),
+                endpoint=step.endpoint,
+            )
+            for step in setup_plan.setup_steps
+        )
+        return setup_code, _JEST_TEARDOWN
 
-    def _summarize_schema(self, schema: dict) -> str:
+    def _payload_json(self, payload: dict) -> str:
+        """
+        Compact JSON for a setup payload, encoded once per payload object
+        (the same create payload is shared by every operation on a resource).
+        """
+        cached = self._payload_json_cache.get(id(payload))
+        if cached is not None and cached[0] is payload:
+            return cached[1]
+        encoded = json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+        self._payload_json_cache[id(payload)] = (payload, encoded)
+        return encoded
+
+    @staticmethod
+    def _summarize_schema(schema: dict) -> str:
         """
         Create a brief summary of a schema for documentation purposes.
         """
@@ -420,235 +891,161 @@ class TestSuiteGenerator:
             return "N/A"
 
         schema_type = schema.get("type", "object")
+        if not isinstance(schema_type, str):
+            return schema_type
 
+        # Reduce the schema to the few fields the summary reads, so identical
+        # error envelopes shared across operations hit the cache
+        prop_names, prop_count, items_type = (), 0, None
         if schema_type == "object":
             props = schema.get("properties", {})
-            if props:
-                prop_names = list(props.keys())[:3]  # Show first 3 properties
-                prop_str = ", ".join(prop_names)
-                if len(props) > 3:
-                    prop_str += ", ..."
-                return f"object with properties: {prop_str}"
-            return "object"
+            prop_names = tuple(islice(props, 3))  # Show first 3 properties
+            prop_count = len(props)
         elif schema_type == "array":
-            items_type = schema.get("items", {}).get("type", "any")
-            return f"array of {items_type}"
-        else:
-            return schema_type
+            # str() keeps the key hashable for list-valued types like ["string", "null"]
+            items_type = str(schema.get("items", {}).get("type", "any"))
+
+        return _summarize_schema_shape(schema_type, prop_names, prop_count, items_type)
 
     def _group_by_operation(self, payloads: List[Dict]) -> Dict[str, List[Dict]]:
-        groups = defaultdict(list)
+        # Reuse the grouping when the same, unchanged-length payload list is
+        # passed again (a list extended in between is regrouped)
+        cached = self._grouped_cache
+        if cached is not None and cached[0] is payloads and cached[1] == len(payloads):
+            return cached[2]
+
+        groups = {}
         for p in payloads:
-            groups[p["operation_id"]].append(p)
+            key = p["operation_id"]
+            group = groups.get(key)
+            if group is None:
+                groups[key] = [p]
+            else:
+                group.append(p)
+
+        self._grouped_cache = (payloads, len(payloads), groups)
         return groups
 
-    def _extract_enum_types_from_ir(self, ir: dict) -> Dict[str, List[str]]:
+    def _extract_enum_metadata_from_ir(
+        self, ir: dict
+    ) -> Tuple[Dict[str, List[str]], Dict[str, Dict[str, str]]]:
         """
-        Extract enum types used by each operation from the IR.
+        Extract the enum types used by each operation and its parameter-to-enum
+        mappings in a single pass over the IR.
 
-        Returns a dict mapping operation_id -> list of enum type names.
+        Returns (enum_types, enum_conversions):
+            enum_types: operation_id -> sorted list of enum type names
+            enum_conversions: operation_id -> {param_name: enum_type_name}
         Only includes types that are actually defined in the IR's types section.
         """
         # Build set of valid types from IR's types section
-        valid_types = set()
-        for type_def in ir.get("types", []):
-            type_id = type_def.get("id")  # Parser uses "id" not "name"
-            if type_id:
-                valid_types.add(type_id)
+        # (parser uses "id" not "name")
+        valid_types = {
+            type_def["id"] for type_def in ir.get("types", []) if type_def.get("id")
+        }
 
-        result = {}
+        ops_enum_types = {}
+        ops_enum_conversions = {}
 
         for op in ir.get("operations", []):
             op_id = op.get("id")
             if not op_id:
                 continue
 
+            inputs = op.get("inputs") or {}
+            body = inputs.get("body") or {}
+            schema = body.get("schema") or {}
             enum_types = set()
 
             # Check body schema for enum types
-            body = op.get("inputs", {}).get("body", {})
             if body:
-                self._collect_enum_types(body.get("schema", {}), enum_types)
+                self._collect_enum_types(schema, enum_types)
 
             # Check parameter schemas
-            for param in op.get("inputs", {}).get("parameters", []):
+            for param in inputs.get("parameters", ()):
                 self._collect_enum_types(param.get("schema", {}), enum_types)
 
             # Filter to only valid types that exist in the source
             valid_enum_types = enum_types & valid_types
             if valid_enum_types:
-                result[op_id] = sorted(valid_enum_types)
-
-        return result
-
-    def _extract_enum_conversions_from_ir(self, ir: dict) -> Dict[str, Dict[str, str]]:
-        """
-        Extract parameter-to-enum-type mappings from the IR.
-
-        Returns a dict mapping operation_id -> {param_name: enum_type_name}
-        Only includes types that are actually defined in the IR's types section.
-        """
-        # Build set of valid types from IR's types section
-        valid_types = set()
-        for type_def in ir.get("types", []):
-            type_id = type_def.get("id")  # Parser uses "id" not "name"
-            if type_id:
-                valid_types.add(type_id)
-
-        result = {}
-
-        for op in ir.get("operations", []):
-            op_id = op.get("id")
-            if not op_id:
-                continue
+                ops_enum_types[op_id] = sorted(valid_enum_types)
 
+            # Body properties whose enum type actually exists in the source
             conversions = {}
-
-            # Check body schema properties for enum types
-            body = op.get("inputs", {}).get("body", {})
-            schema = body.get("schema", {})
-            properties = schema.get("properties", {})
-
-            for prop_name, prop_schema in properties.items():
+            for prop_name, prop_schema in schema.get("properties", {}).items():
                 enum_type = prop_schema.get("x-enum-type")
-                # Only add if this type actually exists in the source
                 if enum_type and enum_type in valid_types:
                     conversions[prop_name] = enum_type
-
             if conversions:
-                result[op_id] = conversions
+                ops_enum_conversions[op_id] = conversions
 
-        return result
+        return ops_enum_types, ops_enum_conversions
 
     def _collect_enum_types(self, schema: dict, enum_types: set):
         """
-        Recursively collect enum type names from a schema.
-        """
-        if not isinstance(schema, dict):
-            return
-
-        # Check for x-enum-type marker
-        if "x-enum-type" in schema:
-            enum_types.add(schema["x-enum-type"])
-
-        # Recurse into properties
-        for prop_schema in schema.get("properties", {}).values():
-            self._collect_enum_types(prop_schema, enum_types)
-
-        # Recurse into items
-        if "items" in schema:
-            self._collect_enum_types(schema["items"], enum_types)
-
-        # Recurse into oneOf/anyOf
-        for variant in schema.get("oneOf", []) + schema.get("anyOf", []):
-            self._collect_enum_types(variant, enum_types)
-
-    def _format_payload_with_enums(self, payload: dict, indent: int = 12) -> str:
+        Collect enum type names from a schema and all nested schemas
+        (properties, items, oneOf/anyOf), using an explicit stack instead of
+        recursion.
         """
-        Format a payload dict for embedding in test code, converting __ENUM__ markers
-        to actual enum references.
-
-        Args:
-            payload: The payload dict to format
-            indent: Indentation level for multiline formatting
-
-        Returns:
-            Formatted Python code string for the payload
-        """
-        import re
-
-        # Use pprint to get a nice representation
-        formatted = pprint.pformat(payload, width=80, indent=4)
-
-        # Convert __ENUM__EnumType.MEMBER__ markers to actual enum references
-        # Pattern matches: '__ENUM__EnumType.MEMBER__' or "__ENUM__EnumType.MEMBER__"
-        def replace_enum(match):
-            enum_ref = match.group(1)  # e.g., "Priority.HIGH"
-            return enum_ref
+        stack = [schema]
+        while stack:
+            node = stack.pop()
+            if not isinstance(node, dict):
+                continue
 
-        # Replace both single and double quoted versions
-        formatted = re.sub(
-            r"['\"]__ENUM__([A-Za-z_][A-Za-z0-9_.]+)__['\"]", replace_enum, formatted
-        )
+            # Check for x-enum-type marker
+            if "x-enum-type" in node:
+                enum_types.add(node["x-enum-type"])
 
-        # Add proper indentation for embedding in test code
-        lines = formatted.split("\n")
-        indented_lines = [lines[0]] + [" " * indent + line for line in lines[1:]]
-        return "\n".join(indented_lines)
+            stack.extend(node.get("properties", {}).values())
+            if "items" in node:
+                stack.append(node["items"])
+            stack.extend(node.get("oneOf", ()))
+            stack.extend(node.get("anyOf", ()))
 
     def _write_jest_config_files(self):
         """
         Generate package.json and jest.config.js with TypeScript support for Jest tests.
         These files are written to the api_jest subdirectory.
         """
-        import json
+        for filename, data in _JEST_CONFIG_FILES:
+            _write_bytes(self._output_path("api_jest", filename), data)
 
-        jest_dir = os.path.join(self.output_dir, "api_jest")
-        os.makedirs(jest_dir, exist_ok=True)
-
-        # Generate package.json with ts-jest and TypeScript dependencies
-        # Uses native fetch (Node.js 18+) so no node-fetch dependency needed
-        package_json = {
-            "name": "testsuitegen-api-tests",
-            "version": "1.0.0",
-            "description": "Auto-generated API tests by TestSuiteGen",
-            "scripts": {
-                "test": "jest --detectOpenHandles",
-                "test:verbose": "jest --verbose --detectOpenHandles",
-            },
-            "devDependencies": {
-                "@types/jest": "^29.5.14",
-                "@types/node": "^22.10.5",
-                "jest": "^29.7.0",
-                "ts-jest": "^29.2.5",
-                "typescript": "^5.7.2",
-            },
-        }
+    def _output_path(self, subdir: str, filename: str) -> str:
+        dir_path = os.path.join(self.output_dir, subdir)
+        if dir_path not in self._created_dirs:
+            os.makedirs(dir_path, exist_ok=True)
+            self._created_dirs.add(dir_path)
+        return os.path.join(dir_path, filename)
 
-        package_json_path = os.path.join(jest_dir, "package.json")
-        with open(package_json_path, "w", encoding="utf-8") as f:
-            json.dump(package_json, f, indent=2)
+    def _write_rendered(
+        self,
+        subdir: str,
+        filename: str,
+        template: Template,
+        context: dict,
+        test_type: str = "api",
+        framework: str = "pytest",
+    ):
+        """
+        Render `template` into `subdir/filename`.
 
-        # Generate jest.config.js with ts-jest preset
-        jest_config = """/** @type {import('ts-jest').JestConfigWithTsJest} */
-module.exports = {
-  preset: 'ts-jest',
-  testEnvironment: 'node',
-  testMatch: ['**/*.test.ts'],
-  moduleFileExtensions: ['ts', 'js', 'json'],
-  transform: {
-    '^.+\\.ts$': 'ts-jest',
-  },
-  testTimeout: 30000,
-  verbose: true,
-};
-"""
-        jest_config_path = os.path.join(jest_dir, "jest.config.js")
-        with open(jest_config_path, "w", encoding="utf-8") as f:
-            f.write(jest_config)
-
-        # Generate tsconfig.json for TypeScript configuration
-        tsconfig = {
-            "compilerOptions": {
-                "target": "ES2020",
-                "module": "commonjs",
-                "lib": ["ES2020"],
-                "strict": True,
-                "esModuleInterop": True,
-                "skipLibCheck": True,
-                "forceConsistentCasingInFileNames": True,
-                "resolveJsonModule": True,
-                "declaration": False,
-                "outDir": "./dist",
-                "rootDir": ".",
-            },
-            "include": ["**/*.ts"],
-            "exclude": ["node_modules", "dist"],
-        }
+        Without an LLM, non-Python output is streamed to the file chunk by
+        chunk instead of being rendered into one string first. Python output
+        (validated with compile()) and LLM-enhanced output need the full text.
+        """
+        if self.llm_provider or filename.endswith(".py"):
+            self._write_file(
+                subdir,
+                filename,
+                template.render(context),
+                test_type=test_type,
+                framework=framework,
+            )
+            return
 
-        tsconfig_path = os.path.join(jest_dir, "tsconfig.json")
-        with open(tsconfig_path, "w", encoding="utf-8") as f:
-            json.dump(tsconfig, f, indent=2)
+        with open(self._output_path(subdir, filename), "wb") as f:
+            template.stream(context).dump(f, encoding="utf-8")
 
     def _write_file(
         self,
@@ -658,45 +1055,122 @@ module.exports = {
         test_type: str = "api",
         framework: str = "pytest",
     ):
-        dir_path = os.path.join(self.output_dir, subdir)
-        os.makedirs(dir_path, exist_ok=True)
-        filepath = os.path.join(dir_path, filename)
+        filepath = self._output_path(subdir, filename)
 
-        content_to_write = content
         if self.llm_provider:
+            # Enhanced concurrently with the other buffered files in finalize()
+            self._pending_enhance.append(
+                _PendingEnhancement(filepath, content, test_type, framework)
+            )
+            return
+
+        self._save_file(filepath, content)
+
+    def _save_file(self, filepath: str, content_to_write: str) -> None:
+        # Validate syntax in memory (no source re-read, no stray .pyc)
+        is_valid_python = False
+        if filepath.endswith(".py"):
             try:
-                if framework == "jest":
-                    content_to_write = enhance_code_ts(
-                        content,
-                        provider=self.llm_provider,
-                        model=self.llm_model,
-                        test_type=test_type,
-                    )
-                else:
-                    content_to_write = enhance_code_python(
-                        content,
-                        provider=self.llm_provider,
-                        model=self.llm_model,
-                        test_type=test_type,
-                    )
-            except Exception as e:
-                # Rate limits or API failures: fall back to unenhanced code and disable LLM for subsequent files
+                compile(content_to_write, filepath, "exec")
+                is_valid_python = True
+            except (SyntaxError, ValueError) as e:
+                logger.debug(
+                    "write: %s has invalid syntax, skipping black: %s", filepath, e
+                )
+
+        _write_bytes(filepath, content_to_write.encode("utf-8"))
+
+        # Queue Python files for black after saving, only if syntax is valid
+        if is_valid_python:
+            self._pending_format.append(filepath)
+
+    def _enhance(self, item: "_PendingEnhancement") -> str:
+        """Run the LLM polisher on one buffered file (blocking)."""
+        provider = self.llm_provider
+        if not provider:
+            # Disabled by an earlier failure
+            return item.content
+        try:
+            # Enhancers pull in the LLM client stack; import only when used
+            if item.framework == "jest":
+                from testsuitegen.src.llm_enhancer.typescript_enhancer.test_suite_enhancer.enhancer import (
+                    enhance_code as enhance_code_ts,
+                )
+
+                return enhance_code_ts(
+                    item.content,
+                    provider=provider,
+                    model=self.llm_model,
+                    test_type=item.test_type,
+                )
+            from testsuitegen.src.llm_enhancer.python_enhancer.test_suite_enhancer.enhancer import (
+                enhance_code as enhance_code_python,
+            )
+
+            return enhance_code_python(
+                item.content,
+                provider=provider,
+                model=self.llm_model,
+                test_type=item.test_type,
+            )
+        except Exception as e:
+            # Rate limits or API failures: fall back to unenhanced code and disable LLM for subsequent files
+            with self._llm_lock:
                 self.llm_provider = None
+            return item.content
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(content_to_write)
+    async def _enhance_all(self, items: List["_PendingEnhancement"]) -> List[str]:
+        """Enhance `items` concurrently, at most _LLM_MAX_CONCURRENCY at a time."""
+        semaphore = asyncio.Semaphore(_LLM_MAX_CONCURRENCY)
+        loop = asyncio.get_running_loop()
 
-        # Format Python files with black after saving, only if syntax is valid
-        if filename.endswith(".py"):
-            try:
-                import subprocess
-                import py_compile
+        async def _enhance_one(item: _PendingEnhancement) -> str:
+            async with semaphore:
+                return await loop.run_in_executor(None, self._enhance, item)
 
-                try:
-                    py_compile.compile(filepath, doraise=True)
-                except py_compile.PyCompileError as ce:
-                    pass
-                else:
-                    subprocess.run(["black", filepath], check=True)
+        return await asyncio.gather(*(_enhance_one(item) for item in items))
+
+    def _flush_enhancements(self) -> None:
+        """Enhance and save every file buffered by _write_file."""
+        items, self._pending_enhance = self._pending_enhance, []
+        if not items:
+            return
+        logger.debug("llm: enhancing %d files concurrently", len(items))
+        contents = asyncio.run(self._enhance_all(items))
+        for item, content in zip(items, contents):
+            self._save_file(item.filepath, content)
+
+    def finalize(self):
+        """
+        Enhance and save files buffered for the LLM, then format every queued
+        Python file with black (in-process, or one CLI run if black is not
+        importable).
+
+        Called at the end of each generate_* method; safe to call again (the
+        queues are drained). Must not be called from a running event loop.
+        """
+        self._flush_enhancements()
+
+        paths, self._pending_format = self._pending_format, []
+        if not paths:
+            return
+        try:
+            import black
+        except ImportError:
+            # No black in this interpreter: fall back to the CLI on PATH
+            try:
+                subprocess.run(["black", *paths], check=True)
             except Exception as e:
                 pass
+            return
+
+        # In-process: no interpreter start-up or black import per run. Syntax
+        # was already validated in _save_file, so skip black's AST check.
+        mode = black.Mode()
+        for path in paths:
+            try:
+                black.format_file_in_place(
+                    Path(path), fast=True, mode=mode, write_back=black.WriteBack.YES
+                )
+            except Exception as e:
+                logger.debug("format: black failed on %s: %s", path, e)
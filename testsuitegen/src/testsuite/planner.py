@@ -5,13 +5,47 @@ Plans the test data setup based on analysis results.
 Determines exactly what resources need to be created and in what order.
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass, field
 
 from testsuitegen.src.testsuite.analyzer import TestAnalysis, ResourceRequirement
 
+# Field-name patterns checked in order by _get_default_value:
+# (substring of the lowercased name, default, required schema type or None)
+_NAME_DEFAULTS = (
+    ("email", "test@example.com", None),
+    ("name", "Test Resource", None),
+    ("id", 10000, "integer"),
+    ("amount", 100.00, None),
+    ("status", "active", None),
+    ("description", "Test description", None),
+)
 
-@dataclass
+
+def _default_integer(schema: Dict) -> int:
+    minimum = schema.get("minimum", 0)
+    maximum = schema.get("maximum", 99999)
+    return (minimum + maximum) // 2 if maximum else minimum + 1
+
+
+def _default_number(schema: Dict) -> float:
+    minimum = schema.get("minimum", 0)
+    maximum = schema.get("maximum", 10000)
+    return float((minimum + maximum) / 2) if maximum else float(minimum + 1)
+
+
+# Schema type -> default factory, used when no field-name pattern matches
+_TYPE_DEFAULTS = {
+    "string": lambda schema: "test" + ("x" * max(0, schema.get("minLength", 1) - 4)),
+    "integer": _default_integer,
+    "number": _default_number,
+    "boolean": lambda schema: True,
+    "array": lambda schema: [],
+    "object": lambda schema: {},
+}
+
+
+@dataclass(slots=True)
 class SetupStep:
     """A single step in the test data setup plan."""
 
@@ -26,7 +60,7 @@ class SetupStep:
     depends_on: List[int] = field(default_factory=list)  # Step IDs this depends on
 
 
-@dataclass
+@dataclass(slots=True)
 class TeardownStep:
     """A single step in the teardown plan."""
 
@@ -35,7 +69,7 @@ class TeardownStep:
     variable_name: str  # Variable containing the resource ID
 
 
-@dataclass
+@dataclass(slots=True)
 class SetupPlan:
     """Complete setup and teardown plan for a test file."""
 
@@ -58,16 +92,20 @@ class SetupPlanner:
 
     def __init__(self, payloads: List[Dict]):
         self.payloads = payloads
-        self._payload_cache: Dict[str, Dict] = {}
         self._build_payload_cache()
+        # (all_analyses, its size, POST path -> op_id) from the last plan() call
+        self._post_index: Optional[Tuple[Dict, int, Dict[str, str]]] = None
+        # (id(schema), required fields) -> (schema, payload) (see _infer_payload_from_schema)
+        self._infer_cache: Dict[Tuple[int, Tuple[str, ...]], Tuple[Dict, Dict]] = {}
 
     def _build_payload_cache(self) -> None:
-        """Cache HAPPY_PATH payloads by operation_id."""
-        for payload in self.payloads:
-            op_id = payload.get("operation_id", "")
-            intent = payload.get("intent", "").upper()
-            if intent == "HAPPY_PATH" and op_id:
-                self._payload_cache[op_id] = payload.get("payload", {})
+        """Cache HAPPY_PATH payloads by operation_id (the last one wins)."""
+        self._payload_cache: Dict[str, Dict] = {
+            payload["operation_id"]: payload.get("payload", {})
+            for payload in self.payloads
+            if payload.get("operation_id")
+            and payload.get("intent", "").upper() == "HAPPY_PATH"
+        }
 
     def plan(
         self, analysis: TestAnalysis, all_analyses: Dict[str, TestAnalysis]
@@ -87,52 +125,79 @@ class SetupPlanner:
         if not analysis.needs_setup:
             return plan
 
-        step_id = 0
+        post_index = self._build_post_index(all_analyses)
+        requirements = analysis.resource_requirements
+        # Step ids are 1-based positions; each step stores its result in
+        # created_<resource_type>, and its id in created_<resource_type>_id
+        variables = ["created_" + r.resource_type for r in requirements]
 
-        for requirement in analysis.resource_requirements:
-            step_id += 1
-
-            # Find the payload to use for creating this resource
-            create_payload = self._find_create_payload(
-                requirement, analysis, all_analyses
-            )
-
-            # Create the setup step
-            setup_step = SetupStep(
+        plan.setup_steps = [
+            SetupStep(
                 step_id=step_id,
                 action="create",
                 resource_type=requirement.resource_type,
                 endpoint=requirement.endpoint,
                 method="POST",
-                payload=create_payload,
-                variable_name=f"created_{requirement.resource_type}",
+                payload=self._find_create_payload(requirement, analysis, post_index),
+                variable_name=variable,
                 id_extraction=f"response.json()['{requirement.id_field}']",
             )
-            plan.setup_steps.append(setup_step)
-
-            # Create the teardown step
-            teardown_step = TeardownStep(
+            for step_id, (requirement, variable) in enumerate(
+                zip(requirements, variables), 1
+            )
+        ]
+        plan.teardown_steps = [
+            TeardownStep(
                 step_id=step_id,
                 endpoint_template=f"{requirement.endpoint}/{{{requirement.param_name}}}",
-                variable_name=f"created_{requirement.resource_type}_id",
+                variable_name=variable + "_id",
             )
-            plan.teardown_steps.append(teardown_step)
-
-            # Map the placeholder to the variable
-            plan.placeholder_mappings["USE_CREATED_RESOURCE"] = (
-                f"created_{requirement.resource_type}_id"
+            for step_id, (requirement, variable) in enumerate(
+                zip(requirements, variables), 1
+            )
+        ]
+
+        if requirements:
+            # The generic placeholder maps to the last required resource, the
+            # specific ones to their own resource
+            mappings = plan.placeholder_mappings
+            mappings["USE_CREATED_RESOURCE"] = variables[-1] + "_id"
+            mappings.update(
+                ("USE_CREATED_RESOURCE_" + r.resource_type.upper(), variable + "_id")
+                for r, variable in zip(requirements, variables)
             )
-            plan.placeholder_mappings[
-                f"USE_CREATED_RESOURCE_{requirement.resource_type.upper()}"
-            ] = f"created_{requirement.resource_type}_id"
 
         return plan
 
+    def _build_post_index(
+        self, all_analyses: Dict[str, TestAnalysis]
+    ) -> Dict[str, str]:
+        """
+        Map each POST path to the first operation on it with a HAPPY_PATH payload.
+
+        The generator plans every operation against the same analyses map, so
+        the index is built once and reused until a different map is passed.
+        """
+        cached = self._post_index
+        if (
+            cached is not None
+            and cached[0] is all_analyses
+            and cached[1] == len(all_analyses)
+        ):
+            return cached[2]
+
+        index: Dict[str, str] = {}
+        for op_id, op_analysis in all_analyses.items():
+            if op_analysis.method == "POST" and op_id in self._payload_cache:
+                index.setdefault(op_analysis.path, op_id)
+        self._post_index = (all_analyses, len(all_analyses), index)
+        return index
+
     def _find_create_payload(
         self,
         requirement: ResourceRequirement,
         analysis: TestAnalysis,
-        all_analyses: Dict[str, TestAnalysis],
+        post_index: Dict[str, str],
     ) -> Dict:
         """
         Find the best payload to use for creating a prerequisite resource.
@@ -150,13 +215,9 @@ class SetupPlanner:
                 return self._payload_cache[create_op_id]
 
         # Try to find any POST operation to the same endpoint
-        for op_id, op_analysis in all_analyses.items():
-            if (
-                op_analysis.method == "POST"
-                and op_analysis.path == requirement.endpoint
-            ):
-                if op_id in self._payload_cache:
-                    return self._payload_cache[op_id]
+        op_id = post_index.get(requirement.endpoint)
+        if op_id is not None:
+            return self._payload_cache[op_id]
 
         # Infer minimal payload from schema
         return self._infer_payload_from_schema(
@@ -169,7 +230,27 @@ class SetupPlanner:
         """
         Infer a minimal valid payload from schema.
         Uses conservative default values.
+
+        Memoized per schema object and required fields. Each call gets its
+        own copy, including fresh list/dict defaults, so callers may mutate it.
+        Empty schemas (often a fresh `{}` fallback) are not cached.
         """
+        if not schema:
+            return self._build_inferred_payload(schema, required_fields)
+
+        key = (id(schema), tuple(required_fields))
+        cached = self._infer_cache.get(key)
+        # The cache holds `schema` itself, so its id cannot be reused meanwhile
+        if cached is None or cached[0] is not schema:
+            cached = (schema, self._build_inferred_payload(schema, required_fields))
+            self._infer_cache[key] = cached
+        # Container defaults are always empty, so a shallow copy of each is fresh
+        return {
+            name: value.copy() if isinstance(value, (list, dict)) else value
+            for name, value in cached[1].items()
+        }
+
+    def _build_inferred_payload(self, schema: Dict, required_fields: List[str]) -> Dict:
         payload = {}
         properties = schema.get("properties", {})
 
@@ -184,36 +265,15 @@ class SetupPlanner:
         field_type = field_schema.get("type", "string")
 
         # Common field name patterns
-        if "email" in field_name.lower():
-            return "test@example.com"
-        if "name" in field_name.lower():
-            return "Test Resource"
-        if "id" in field_name.lower() and field_type == "integer":
-            return 10000
-        if "amount" in field_name.lower():
-            return 100.00
-        if "status" in field_name.lower():
-            return "active"
-        if "description" in field_name.lower():
-            return "Test description"
-
-        # Type-based defaults
-        if field_type == "string":
-            min_len = field_schema.get("minLength", 1)
-            return "test" + ("x" * max(0, min_len - 4))
-        if field_type == "integer":
-            minimum = field_schema.get("minimum", 0)
-            maximum = field_schema.get("maximum", 99999)
-            return (minimum + maximum) // 2 if maximum else minimum + 1
-        if field_type == "number":
-            minimum = field_schema.get("minimum", 0)
-            maximum = field_schema.get("maximum", 10000)
-            return float((minimum + maximum) / 2) if maximum else float(minimum + 1)
-        if field_type == "boolean":
-            return True
-        if field_type == "array":
-            return []
-        if field_type == "object":
-            return {}
-
-        return "test_value"
+        lowered = field_name.lower()
+        for pattern, default, required_type in _NAME_DEFAULTS:
+            if pattern in lowered and (
+                required_type is None or required_type == field_type
+            ):
+                return default
+
+        # Type-based defaults ("type" may also be a list, which has no entry)
+        type_default = (
+            _TYPE_DEFAULTS.get(field_type) if isinstance(field_type, str) else None
+        )
+        return type_default(field_schema) if type_default else "test_value"
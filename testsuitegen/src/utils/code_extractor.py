@@ -1,9 +1,31 @@
 import ast
+import functools
+import hashlib
 import logging
+import os
+import re
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set
+from testsuitegen.src.config.settings import (
+    EXTRACT_CACHE_DIR,
+    EXTRACT_CACHE_MAX_ENTRIES,
+)
 from testsuitegen.src.utils.tree_sitter_loader import get_parser
 
 logger = logging.getLogger(__name__)
 
+# Parsed sources kept per language. Extraction is typically repeated for every
+# function of the same module, so only the cheap node selection reruns.
+_PARSE_CACHE_SIZE = 64
+
+_NEWLINE_RE = re.compile(r"\r\n|\r|\n")
+
+# Extracted contexts optionally persisted across runs (EXTRACT_CACHE_DIR),
+# one file per (language, target, source) digest. Bump the version whenever
+# the extraction output changes so stale entries are not reused.
+_EXTRACT_CACHE_VERSION = "1"
+
 
 def extract_relevant_context(
     source_code: str, target_function_name: str, language: str = "python"
@@ -22,93 +44,240 @@ def extract_relevant_context(
         Returns original source_code if extraction fails or function is not found.
     """
     if language == "python":
-        return _extract_python_context(source_code, target_function_name)
+        extract = _extract_python_context
     elif language == "typescript":
-        return _extract_typescript_context(source_code, target_function_name)
+        extract = _extract_typescript_context
     else:
         logger.warning(
             f"Unsupported language {language} for context extraction. Returning full source."
         )
         return source_code
 
+    if not EXTRACT_CACHE_DIR or not isinstance(target_function_name, str):
+        return extract(source_code, target_function_name)
 
-def _extract_python_context(source_code: str, target_function_name: str) -> str:
+    cache_path = _extract_cache_path(source_code, target_function_name, language)
+    cached = _read_cached_extract(cache_path)
+    if cached is not None:
+        return cached
+
+    context = extract(source_code, target_function_name)
+    # Fallbacks return the source itself, which is not worth persisting
+    if context is not source_code:
+        _write_cached_extract(cache_path, context)
+    return context
+
+
+def _extract_cache_path(
+    source_code: str, target_function_name: str, language: str
+) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (_EXTRACT_CACHE_VERSION, language, target_function_name):
+        digest.update(part.encode("utf-8", "surrogatepass"))
+        digest.update(b"\0")
+    digest.update(source_code.encode("utf-8", "surrogatepass"))
+    return os.path.join(EXTRACT_CACHE_DIR, digest.hexdigest())
+
+
+def _read_cached_extract(path: str) -> Optional[str]:
     try:
-        tree = ast.parse(source_code)
-        relevant_nodes = []
-        target_found = False
-        source_lines = source_code.splitlines(keepends=True)
-
-        for node in tree.body:
-            # 1. Keep all Class Definitions (potential types/enums)
-            if isinstance(node, ast.ClassDef):
-                relevant_nodes.append(node)
-            # 2. Keep the Target Function
-            elif (
-                isinstance(node, ast.FunctionDef) and node.name == target_function_name
-            ):
-                relevant_nodes.append(node)
-                target_found = True
-            # 3. Keep Assignments (potential Type Aliases or Constants)
-            elif isinstance(node, (ast.Assign, ast.AnnAssign)):
-                relevant_nodes.append(node)
-            # 4. Keep Imports
-            elif isinstance(node, (ast.Import, ast.ImportFrom)):
-                relevant_nodes.append(node)
+        with open(path, encoding="utf-8", newline="") as f:
+            return f.read()
+    except (OSError, UnicodeDecodeError):
+        return None
 
-        if not target_found:
-            logger.warning(
-                f"Target function '{target_function_name}' not found in Python source. Returning full source."
+
+def _write_cached_extract(path: str, context: str) -> None:
+    """Persist an extract atomically (owner-only); the cache is best effort."""
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(EXTRACT_CACHE_DIR, mode=0o700, exist_ok=True)
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with open(fd, "w", encoding="utf-8", newline="") as f:
+            f.write(context)
+        os.replace(tmp_path, path)
+    except (OSError, UnicodeError) as e:
+        logger.debug("code_extractor: could not cache extract: %s", e)
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        return
+    _prune_extract_cache()
+
+
+def _prune_extract_cache() -> None:
+    """Drop the oldest entries beyond EXTRACT_CACHE_MAX_ENTRIES."""
+    try:
+        entries = [
+            entry
+            for entry in os.scandir(EXTRACT_CACHE_DIR)
+            if entry.is_file() and not entry.name.endswith(".tmp")
+        ]
+        excess = len(entries) - EXTRACT_CACHE_MAX_ENTRIES
+        if excess <= 0:
+            return
+        entries.sort(key=lambda entry: entry.stat().st_mtime_ns)
+        for entry in entries[:excess]:
+            os.remove(entry.path)
+    except OSError as e:
+        logger.debug("code_extractor: could not prune extract cache: %s", e)
+
+
+@dataclass(slots=True)
+class PyIndex:
+    """Top-level nodes of a Python module, grouped by what context keeps."""
+
+    classes: List[ast.ClassDef]
+    assigns: List[ast.stmt]
+    imports: List[ast.stmt]
+    funcs: Dict[str, List[ast.FunctionDef]]
+    # Names of (async) methods defined directly in a top-level class body
+    methods: Set[str]
+    # Offset of the first character of each line, plus len(source) at the end
+    line_starts: List[int]
+
+
+@functools.lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _parse_python(source_code: str) -> PyIndex:
+    """Parse and index Python source (cached per source text; callers must not mutate)."""
+    line_starts = [0]
+    line_starts.extend(m.end() for m in _NEWLINE_RE.finditer(source_code))
+    if line_starts[-1] != len(source_code):
+        line_starts.append(len(source_code))
+    index = PyIndex(
+        classes=[],
+        assigns=[],
+        imports=[],
+        funcs={},
+        methods=set(),
+        line_starts=line_starts,
+    )
+    for node in ast.parse(source_code).body:
+        if isinstance(node, ast.ClassDef):
+            index.classes.append(node)
+            index.methods.update(
+                child.name
+                for child in node.body
+                if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef))
             )
+        elif isinstance(node, ast.FunctionDef):
+            index.funcs.setdefault(node.name, []).append(node)
+        elif isinstance(node, (ast.Assign, ast.AnnAssign)):
+            index.assigns.append(node)
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            index.imports.append(node)
+    return index
+
+
+@functools.lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _parse_typescript(source_code: str):
+    """
+    Parse TypeScript source (cached per source text).
+
+    Returns the UTF-8 encoded source with its tree-sitter Tree; node offsets
+    are byte offsets into that buffer, not indices into `source_code`.
+    """
+    source_bytes = source_code.encode("utf-8")
+    return source_bytes, get_parser("typescript").parse(source_bytes)
+
+
+def _log_target_missing(target_function_name: str, source_kind: str) -> None:
+    logger.warning(
+        f"Target function '{target_function_name}' not found in {source_kind} source. Returning full source."
+    )
+
+
+def _extract_python_context(source_code: str, target_function_name: str) -> str:
+    try:
+        # A function cannot be defined without its name appearing in the
+        # source, so skip parsing sources that do not mention it at all
+        if target_function_name not in source_code:
+            _log_target_missing(target_function_name, "Python")
             return source_code
 
-        extracted_code = []
-        for node in relevant_nodes:
-            if hasattr(node, "lineno") and hasattr(node, "end_lineno"):
-                start = node.lineno - 1
-                end = node.end_lineno
-                extracted_code.append("".join(source_lines[start:end]))
+        index = _parse_python(source_code)
+        target_nodes = index.funcs.get(target_function_name)
+
+        if not target_nodes:
+            # A method target is covered by its class, which is always kept
+            if target_function_name not in index.methods:
+                _log_target_missing(target_function_name, "Python")
+                return source_code
+            target_nodes = []
+
+        # Classes (potential types/enums), assignments (type aliases or
+        # constants), imports and the target function, in source order
+        relevant_nodes = sorted(
+            index.classes + index.assigns + index.imports + target_nodes,
+            key=lambda node: (node.lineno, node.col_offset),
+        )
+        line_starts = index.line_starts
 
-        return "\n\n".join(extracted_code)
+        return "\n\n".join(
+            source_code[line_starts[node.lineno - 1] : line_starts[node.end_lineno]]
+            for node in relevant_nodes
+        )
 
     except Exception as e:
         logger.error(f"Error parsing Python source: {e}")
         return source_code
 
 
+def _class_defines(class_node, target_name: bytes, node_text) -> bool:
+    """Whether a class declaration node has a method named `target_name` (UTF-8)."""
+    body = class_node.child_by_field_name("body")
+    if body is None:
+        return False
+    # method definition types may vary between grammars: 'method_definition', 'public_field_definition', etc.
+    for member in body.named_children:
+        if member.type in ("method_definition", "function", "method_signature"):
+            name_node = member.child_by_field_name("name")
+            if name_node and node_text(name_node) == target_name:
+                return True
+    return False
+
+
 def _extract_typescript_context(source_code: str, target_function_name: str) -> str:
     try:
-        parser = get_parser("typescript")
-        tree = parser.parse(bytes(source_code, "utf8"))
+        if target_function_name not in source_code:
+            _log_target_missing(target_function_name, "TS")
+            return source_code
+
+        source_bytes, tree = _parse_typescript(source_code)
         root = tree.root_node
+        target_name = target_function_name.encode("utf-8")
 
         def node_text(node):
-            return source_code[node.start_byte : node.end_byte]
+            return source_bytes[node.start_byte : node.end_byte]
 
         nodes_to_keep = []
         target_found = False
 
-        # Top-level pass: pick imports, types, classes, enums, top-level functions, exports
+        # Single pass: pick imports, types, classes, enums, top-level functions,
+        # exports, and look for the function as a method of each class
         for child in root.children:
             t = child.type
 
-            # Keep imports, interfaces, type aliases, classes, enums
+            # Keep imports, interfaces, type aliases, enums
             if t in (
                 "import_statement",
                 "interface_declaration",
                 "type_alias_declaration",
-                "class_declaration",
                 "enum_declaration",
             ):
                 nodes_to_keep.append(child)
 
+            # Keep classes; a class defining the target counts as finding it
+            elif t == "class_declaration":
+                nodes_to_keep.append(child)
+                if not target_found and _class_defines(child, target_name, node_text):
+                    target_found = True
+
             # Top-level function
             elif t == "function_declaration":
-                # find identifier child
-                id_node = next(
-                    (c for c in child.children if c.type == "identifier"), None
-                )
-                if id_node and node_text(id_node) == target_function_name:
+                id_node = child.child_by_field_name("name")
+                if id_node and node_text(id_node) == target_name:
                     nodes_to_keep.append(child)
                     target_found = True
 
@@ -125,11 +294,8 @@ def _extract_typescript_context(source_code: str, target_function_name: str) ->
                     ):
                         # if it's a function, check name; otherwise keep it for context
                         if named.type == "function_declaration":
-                            id_node = next(
-                                (c for c in named.children if c.type == "identifier"),
-                                None,
-                            )
-                            if id_node and node_text(id_node) == target_function_name:
+                            id_node = named.child_by_field_name("name")
+                            if id_node and node_text(id_node) == target_name:
                                 nodes_to_keep.append(
                                     child
                                 )  # include the whole export_statement
@@ -139,56 +305,25 @@ def _extract_typescript_context(source_code: str, target_function_name: str) ->
                                 nodes_to_keep.append(named)
                         else:
                             nodes_to_keep.append(named)
-
-        # Second pass: search for the function as a method inside classes; if found, include the class
-        for child in root.children:
-            if child.type == "class_declaration":
-                # class body typically is a child named 'class_body' or has method_definition nodes inside
-                for member in child.named_children:
-                    # method definition types may vary between grammars: 'method_definition', 'public_field_definition', etc.
-                    if member.type in (
-                        "method_definition",
-                        "function",
-                        "method_signature",
-                    ):
-                        # method name can be 'property_identifier' or 'identifier' or similar
-                        name_node = next(
-                            (
-                                c
-                                for c in member.children
-                                if c.type in ("property_identifier", "identifier")
-                            ),
-                            None,
-                        )
-                        if name_node and node_text(name_node) == target_function_name:
-                            nodes_to_keep.append(child)
-                            target_found = True
-                            break
-                if target_found:
-                    # no need to search other classes once found (optional)
-                    pass
+                            if (
+                                named.type == "class_declaration"
+                                and not target_found
+                                and _class_defines(named, target_name, node_text)
+                            ):
+                                target_found = True
 
         if not target_found:
-            logger.warning(
-                f"Target function '{target_function_name}' not found in TS source. Returning full source."
-            )
+            _log_target_missing(target_function_name, "TS")
             return source_code
 
         # Deduplicate by (start_byte, end_byte) and sort by position
-        seen_ranges = set()
-        unique_nodes = []
+        unique = {}
         for n in nodes_to_keep:
-            key = (n.start_byte, n.end_byte)
-            if key not in seen_ranges:
-                seen_ranges.add(key)
-                unique_nodes.append(n)
-
-        unique_nodes.sort(key=lambda n: n.start_byte)
-
-        # Extract text parts
-        extracted_parts = [node_text(n) for n in unique_nodes]
+            unique.setdefault((n.start_byte, n.end_byte), n)
+        unique_nodes = sorted(unique.values(), key=lambda n: n.start_byte)
 
-        return "\n\n".join(extracted_parts)
+        # Extract text parts, decoding once at the end
+        return b"\n\n".join(node_text(n) for n in unique_nodes).decode("utf-8")
 
     except Exception as e:
         logger.error(f"Error parsing TypeScript source: {e}")
@@ -1,18 +1,38 @@
+import functools
+import threading
+
 import tree_sitter_typescript
 import tree_sitter_python
 from tree_sitter import Language, Parser
 
+# Parsers are reused per thread: a Parser holds mutable parse state, so one
+# instance is not shared between threads.
+_local = threading.local()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_language(language_name: str) -> Language:
+    """Build the tree-sitter Language for `language_name` once per process."""
+    if language_name == "typescript":
+        return Language(tree_sitter_typescript.language_typescript())
+    if language_name == "python":
+        return Language(tree_sitter_python.language())
+    raise ValueError(f"Unsupported language for tree-sitter: {language_name}")
+
 
 def get_parser(language_name: str) -> Parser:
     """
     Returns a configured Tree-Sitter parser for the specified language.
+
+    The parser is cached and reused by later calls from the same thread.
     """
-    if language_name == "typescript":
-        language = Language(tree_sitter_typescript.language_typescript())
-    elif language_name == "python":
-        language = Language(tree_sitter_python.language())
-    else:
-        raise ValueError(f"Unsupported language for tree-sitter: {language_name}")
+    parsers = getattr(_local, "parsers", None)
+    if parsers is None:
+        parsers = _local.parsers = {}
 
-    parser = Parser(language)
+    parser = parsers.get(language_name)
+    if parser is None:
+        # Raises ValueError for unsupported languages before caching
+        parser = Parser(_get_language(language_name))
+        parsers[language_name] = parser
     return parser